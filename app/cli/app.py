@@ -2,6 +2,7 @@
 Radiant TUI Application using Textual.
 """
 import getpass
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,12 @@ from textual.widgets import Static, Footer, Input, Button, Label
 from textual.screen import Screen
 
 from app.data.database import SecureDatabase
+from app.cli.widgets.header import BANNER
+
+
+def _preload_screens() -> None:
+    """Import the screen modules so they are cached before first navigation."""
+    import app.cli.screens  # noqa: F401
 
 
 class PasswordScreen(Screen):
@@ -21,6 +28,8 @@ class PasswordScreen(Screen):
         Binding("escape", "quit", "Quit"),
     ]
 
+    _BANNER = f"\n{BANNER}\n"
+
     def __init__(self, first_time: bool = False):
         super().__init__()
         self.first_time = first_time
@@ -29,7 +38,7 @@ class PasswordScreen(Screen):
 
     def compose(self) -> ComposeResult:
         yield Container(
-            Static(self._get_banner(), id="banner"),
+            Static(self._BANNER, id="banner"),
             Static(
                 "Welcome! Set a password to encrypt your data."
                 if self.first_time else
@@ -49,16 +58,6 @@ class PasswordScreen(Screen):
         )
         yield Footer()
 
-    def _get_banner(self) -> str:
-        return """
-[#00d26a]  ██████╗  █████╗ ██████╗ ██╗ █████╗ ███╗   ██╗████████╗[/]
-[#00b85c]  ██╔══██╗██╔══██╗██╔══██╗██║██╔══██╗████╗  ██║╚══██╔══╝[/]
-[#00a050]  ██████╔╝███████║██║  ██║██║███████║██╔██╗ ██║   ██║   [/]
-[#008744]  ██╔══██╗██╔══██║██║  ██║██║██╔══██║██║╚██╗██║   ██║   [/]
-[#006e38]  ██║  ██║██║  ██║██████╔╝██║██║  ██║██║ ╚████║   ██║   [/]
-[#00552c]  ╚═╝  ╚═╝╚═╝  ╚═╝╚═════╝ ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝   ╚═╝   [/]
-"""
-
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "unlock-btn":
             self._handle_unlock()
@@ -94,6 +93,8 @@ class PasswordScreen(Screen):
 class PasswordSubmitted:
     """Message sent when password is submitted."""
 
+    __slots__ = ("password",)
+
     def __init__(self, password: str):
         self.password = password
 
@@ -113,16 +114,22 @@ class RadiantApp(App):
         Binding("?", "help", "Help"),
     ]
 
+    _HELP_TEXT = "h=Home  n=Check-In  t=Tasks  e=Export  q=Quit"
+
     def __init__(self, data_dir: Path, encrypted: bool = True):
         super().__init__()
         self.data_dir = data_dir
         self.encrypted = encrypted
         self.db: Optional[SecureDatabase] = None
+        self._screens: dict[str, type[Screen]] = {}
 
     def on_mount(self) -> None:
         """Called when app is mounted."""
         self.db = SecureDatabase(self.data_dir, encrypted=self.encrypted)
 
+        # Import the screens while the user types the password and the key is derived
+        threading.Thread(target=_preload_screens, daemon=True).start()
+
         if self.encrypted:
             first_time = not self.db.db_path.exists()
             self.push_screen(PasswordScreen(first_time=first_time))
@@ -145,41 +152,42 @@ class RadiantApp(App):
         if from_password_screen:
             self.pop_screen()
 
-        from app.cli.screens.home import HomeScreen
-        self.push_screen(HomeScreen())
+        # Waits on the preload thread if it is still importing
+        from app.cli.screens import HomeScreen, BalancesScreen, TasksScreen, ExportScreen
+        self._screens = {
+            "home": HomeScreen,
+            "balances": BalancesScreen,
+            "tasks": TasksScreen,
+            "export": ExportScreen,
+        }
+
+        self.push_screen(self._screens["home"]())
 
     def action_go_home(self) -> None:
         """Navigate to home screen."""
         if self.db and self.db.is_connected:
             while len(self.screen_stack) > 1:
                 self.pop_screen()
-            from app.cli.screens.home import HomeScreen
-            self.push_screen(HomeScreen())
+            self.push_screen(self._screens["home"]())
 
     def action_new_checkin(self) -> None:
         """Start a new check-in."""
         if self.db and self.db.is_connected:
-            from app.cli.screens.balances import BalancesScreen
-            self.push_screen(BalancesScreen())
+            self.push_screen(self._screens["balances"]())
 
     def action_view_tasks(self) -> None:
         """View financial tasks."""
         if self.db and self.db.is_connected:
-            from app.cli.screens.tasks import TasksScreen
-            self.push_screen(TasksScreen())
+            self.push_screen(self._screens["tasks"]())
 
     def action_export(self) -> None:
         """Show export screen."""
         if self.db and self.db.is_connected:
-            from app.cli.screens.export import ExportScreen
-            self.push_screen(ExportScreen())
+            self.push_screen(self._screens["export"]())
 
     def action_help(self) -> None:
         """Show help."""
-        self.notify(
-            "h=Home  n=Check-In  t=Tasks  e=Export  q=Quit",
-            title="Keyboard Shortcuts"
-        )
+        self.notify(self._HELP_TEXT, title="Keyboard Shortcuts")
 
     def on_unmount(self) -> None:
         """Clean up when app closes."""
@@ -5,8 +5,6 @@ mnm - Radiant Money Manager CLI
 Entry point for the interactive TUI application.
 """
 import argparse
-import json
-import csv
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -36,8 +34,9 @@ def get_password(first_time: bool = False) -> str:
         return getpass.getpass("  Password: ")
 
 
-def export_data(format: str, data_dir: Path, output_dir: Path) -> None:
-    """Export data to JSON or CSV."""
+def export_data(format: str, data_dir: Path, output_dir: Path, compress: bool = False) -> None:
+    """Export data to JSON or CSV, optionally gzip-compressed."""
+    from app.cli.exporter import write_csv_export, write_json_export
     from app.data.database import SecureDatabase
 
     db = SecureDatabase(data_dir, encrypted=True)
@@ -55,31 +54,20 @@ def export_data(format: str, data_dir: Path, output_dir: Path) -> None:
         print(f"Error: Could not open database. Wrong password? {e}")
         sys.exit(1)
 
-    data = db.export_all()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if format == "json":
-        output_path = output_dir / f"radiant_export_{timestamp}.json"
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        suffix = ".json.gz" if compress else ".json"
+        output_path = output_dir / f"radiant_export_{timestamp}{suffix}"
+        write_json_export(db, output_path, compress=compress)
         print(f"Exported to {output_path}")
     else:
         export_dir = output_dir / f"radiant_export_{timestamp}"
         export_dir.mkdir(parents=True, exist_ok=True)
 
-        for key, items in data.items():
-            if items and isinstance(items, list):
-                csv_path = export_dir / f"{key}.csv"
-                if items:
-                    fieldnames = list(items[0].keys())
-                    with open(csv_path, "w", newline="") as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        for item in items:
-                            writer.writerow({k: str(v) if v is not None else "" for k, v in item.items()})
-
+        write_csv_export(db, export_dir, compress=compress)
         print(f"Exported to {export_dir}/")
 
     db.close()
@@ -103,6 +91,8 @@ Examples:
   mnm                    Launch the interactive TUI
   mnm --export json      Export all data to JSON
   mnm --export csv       Export all data to CSV files
+  mnm --export csv --compress
+                         Export gzip-compressed CSV files
         """
     )
     parser.add_argument(
@@ -116,6 +106,11 @@ Examples:
         metavar="FORMAT",
         help="Export data and exit (json or csv)"
     )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Gzip-compress exported files"
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -142,7 +137,7 @@ Examples:
     args = parser.parse_args()
 
     if args.export:
-        export_data(args.export, args.data_dir, args.output_dir)
+        export_data(args.export, args.data_dir, args.output_dir, compress=args.compress)
         return
 
     if args.migrate:
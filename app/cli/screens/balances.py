@@ -1,7 +1,10 @@
 """Balances screen for updating assets and liabilities."""
 
+from uuid import UUID
+
 from textual.app import ComposeResult
 from textual.screen import Screen
+from textual.widget import Widget
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Static, Footer, Button, Input, Label, Select
@@ -25,6 +28,9 @@ class BalancesScreen(Screen):
         self.assets = []
         self.liabilities = []
         self.current_index = 0
+        # Inputs keyed by record id, filled in as the form is built
+        self._asset_inputs: dict[UUID, CurrencyInput] = {}
+        self._liability_inputs: dict[UUID, CurrencyInput] = {}
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -50,26 +56,31 @@ class BalancesScreen(Screen):
     async def on_mount(self) -> None:
         """Load existing data."""
         db = self.app.db
-        self.assets = db.get_assets()
-        self.liabilities = db.get_liabilities()
+        self.assets, self.liabilities = db.get_balances_snapshot()
         await self._build_form()
 
     async def _build_form(self) -> None:
         """Build the form with current balances."""
         form = self.query_one("#balances-form", Vertical)
         form.remove_children()
+        self._asset_inputs.clear()
+        self._liability_inputs.clear()
+
+        # Build every row first so the form lays out once
+        rows: list[Widget] = []
 
         # Assets section
         if self.assets:
-            form.mount(Static("[bold]Assets[/]", classes="section-header"))
+            rows.append(Static("[bold]Assets[/]", classes="section-header"))
             for asset in self.assets:
-                form.mount(
+                input_widget = self._asset_inputs[asset.id] = CurrencyInput(
+                    value=f"{asset.value:,.2f}",
+                    id=f"asset-{asset.id}"
+                )
+                rows.append(
                     Vertical(
                         Label(f"{asset.name} ({asset.type.value})"),
-                        CurrencyInput(
-                            value=f"{asset.value:,.2f}",
-                            id=f"asset-{asset.id}"
-                        ),
+                        input_widget,
                         Static(f"[dim]Current: ${asset.value:,.2f}[/]", classes="input-hint"),
                         classes="question-group"
                     )
@@ -77,15 +88,16 @@ class BalancesScreen(Screen):
 
         # Liabilities section
         if self.liabilities:
-            form.mount(Static("[bold]Liabilities[/]", classes="section-header"))
+            rows.append(Static("[bold]Liabilities[/]", classes="section-header"))
             for liability in self.liabilities:
-                form.mount(
+                input_widget = self._liability_inputs[liability.id] = CurrencyInput(
+                    value=f"{liability.balance:,.2f}",
+                    id=f"liability-{liability.id}"
+                )
+                rows.append(
                     Vertical(
                         Label(f"{liability.name}"),
-                        CurrencyInput(
-                            value=f"{liability.balance:,.2f}",
-                            id=f"liability-{liability.id}"
-                        ),
+                        input_widget,
                         Static(
                             f"[dim]Current: ${liability.balance:,.2f} @ {liability.interest_rate*100:.1f}%[/]",
                             classes="input-hint"
@@ -96,29 +108,31 @@ class BalancesScreen(Screen):
 
         # If no data, show message
         if not self.assets and not self.liabilities:
-            form.mount(
+            rows.append(
                 Static(
                     "No accounts found. Add assets and liabilities via the web app or manage.py.",
                     classes="empty-state"
                 )
             )
 
+        form.mount_all(rows)
+
     def _save_balances(self) -> bool:
         """Save updated balances to database."""
         db = self.app.db
 
         try:
-            # Update assets
+            # Read every input first, then write each table in one transaction
             for asset in self.assets:
-                input_widget = self.query_one(f"#asset-{asset.id}", CurrencyInput)
-                asset.value = input_widget.get_value()
-                db.save_asset(asset)
+                asset.value = self._asset_inputs[asset.id].get_value()
 
-            # Update liabilities
             for liability in self.liabilities:
-                input_widget = self.query_one(f"#liability-{liability.id}", CurrencyInput)
-                liability.balance = input_widget.get_value()
-                db.save_liability(liability)
+                liability.balance = self._liability_inputs[liability.id].get_value()
+
+            if self.assets:
+                db.save_assets(self.assets)
+            if self.liabilities:
+                db.save_liabilities(self.liabilities)
 
             return True
         except Exception as e:
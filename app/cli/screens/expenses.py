@@ -1,6 +1,10 @@
 """Expenses screen for managing upcoming expenses."""
 
+import calendar
+from bisect import bisect_right
 from datetime import date, timedelta
+from operator import attrgetter
+from uuid import UUID
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.binding import Binding
@@ -9,8 +13,13 @@ from textual.widgets import Static, Footer, Button, Input, Label, Select
 
 from app.cli.widgets.header import RadiantHeader
 from app.cli.widgets.currency_input import CurrencyInput
+from app.cli.screens.tasks import TasksScreen
 from app.models import UpcomingExpense, RecurrenceType
 
+# Row formatting helpers, resolved once instead of per row
+_MONTHS = list(calendar.month_abbr)
+_AMT_FMT = "${:,.2f}".format
+
 
 class ExpensesScreen(Screen):
     """Screen for managing upcoming expenses."""
@@ -24,6 +33,11 @@ class ExpensesScreen(Screen):
     def __init__(self):
         super().__init__()
         self.expenses = []
+        self._button_handlers = {
+            "btn-back": self.action_go_back,
+            "btn-next": self.action_save_and_next,
+            "btn-add-expense": self._add_expense,
+        }
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -103,34 +117,64 @@ class ExpensesScreen(Screen):
 
     async def on_mount(self) -> None:
         """Load existing expenses."""
-        await self._refresh_list()
+        await self._build_initial_list()
 
-    async def _refresh_list(self) -> None:
-        """Refresh the expenses list."""
+    async def _build_initial_list(self) -> None:
+        """Build the expenses list from the database."""
         db = self.app.db
         self.expenses = db.get_all_expenses()
 
         expenses_list = self.query_one("#expenses-list", Vertical)
-        expenses_list.remove_children()
+        await expenses_list.remove_children()
 
         if self.expenses:
-            for expense in self.expenses:
-                due_str = expense.due_date.strftime("%b %d, %Y")
-                recur_str = f" ({expense.recurrence.value})" if expense.recurrence != RecurrenceType.NONE else ""
+            expenses_list.mount_all([self._expense_row(expense) for expense in self.expenses])
+        else:
+            expenses_list.mount(self._empty_state())
 
-                expenses_list.mount(
-                    Horizontal(
-                        Static(f"{expense.name}{recur_str}", classes="list-item-title"),
-                        Static(f"${expense.amount:,.2f}", classes="list-item-amount"),
-                        Static(due_str, classes="list-item-date"),
-                        Button("X", id=f"delete-{expense.id}", classes="btn-delete"),
-                        classes="list-item"
-                    )
-                )
+    def _expense_row(self, expense: UpcomingExpense) -> Horizontal:
+        """Build the list row for a single expense."""
+        due = expense.due_date
+        due_str = f"{_MONTHS[due.month]} {due.day:02d}, {due.year}"
+        recur_str = f" ({expense.recurrence.value})" if expense.recurrence != RecurrenceType.NONE else ""
+
+        delete_btn = Button("X", id=f"delete-{expense.id}", classes="btn-delete")
+        delete_btn._expense_uuid = expense.id
+
+        return Horizontal(
+            Static(f"{expense.name}{recur_str}", classes="list-item-title"),
+            Static(_AMT_FMT(expense.amount), classes="list-item-amount"),
+            Static(due_str, classes="list-item-date"),
+            delete_btn,
+            id=f"expense-{expense.id}",
+            classes="list-item"
+        )
+
+    def _empty_state(self) -> Static:
+        """Build the placeholder shown when there are no expenses."""
+        return Static("No upcoming expenses. Add one below.", classes="empty-state")
+
+    def _mount_expense_row(self, expense: UpcomingExpense) -> None:
+        """Insert a row for a new expense, keeping the list ordered by due date."""
+        expenses_list = self.query_one("#expenses-list", Vertical)
+        if not self.expenses:
+            expenses_list.query(".empty-state").remove()
+
+        index = bisect_right(self.expenses, expense.due_date, key=attrgetter("due_date"))
+        row = self._expense_row(expense)
+        if index < len(self.expenses):
+            expenses_list.mount(row, before=f"#expense-{self.expenses[index].id}")
         else:
-            expenses_list.mount(
-                Static("No upcoming expenses. Add one below.", classes="empty-state")
-            )
+            expenses_list.mount(row)
+        self.expenses.insert(index, expense)
+
+    def _unmount_expense_row(self, expense_id: UUID) -> None:
+        """Remove the row for a deleted expense."""
+        self.query_one(f"#expense-{expense_id}", Horizontal).remove()
+        self.expenses = [e for e in self.expenses if e.id != expense_id]
+
+        if not self.expenses:
+            self.query_one("#expenses-list", Vertical).mount(self._empty_state())
 
     def _add_expense(self) -> None:
         """Add a new expense from form data."""
@@ -181,26 +225,25 @@ class ExpensesScreen(Screen):
         recurrence_select.value = "none"
 
         self.notify(f"Added expense: {name}")
-        self._refresh_list()
+        self._mount_expense_row(expense)
+
+    def _delete_expense(self, expense_id: UUID) -> None:
+        """Delete an expense and remove its row."""
+        db = self.app.db
+        db.delete_expense(expense_id)
+        self.notify("Expense deleted")
+        self._unmount_expense_row(expense_id)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        if button_id == "btn-back":
-            self.app.pop_screen()
-        elif button_id == "btn-next":
-            from app.cli.screens.tasks import TasksScreen
-            self.app.switch_screen(TasksScreen())
-        elif button_id == "btn-add-expense":
-            self._add_expense()
-        elif button_id and button_id.startswith("delete-"):
-            expense_id = button_id.replace("delete-", "")
-            from uuid import UUID
-            db = self.app.db
-            db.delete_expense(UUID(expense_id))
-            self.notify("Expense deleted")
-            self._refresh_list()
+        expense_id = getattr(event.button, "_expense_uuid", None)
+        if expense_id is not None:
+            self._delete_expense(expense_id)
+            return
+
+        handler = self._button_handlers.get(event.button.id)
+        if handler:
+            handler()
 
     def action_go_back(self) -> None:
         """Go back to previous screen."""
@@ -208,7 +251,6 @@ class ExpensesScreen(Screen):
 
     def action_save_and_next(self) -> None:
         """Save and go to next screen."""
-        from app.cli.screens.tasks import TasksScreen
         self.app.switch_screen(TasksScreen())
 
     def action_add_expense(self) -> None:
@@ -1,15 +1,15 @@
 """Export screen for exporting financial data."""
 
-import json
-import csv
 from pathlib import Path
 from datetime import datetime
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
-from textual.widgets import Static, Footer, Button, Input, Label, RadioSet, RadioButton
+from textual.widgets import Static, Footer, Button, Input, Label, RadioSet, RadioButton, Checkbox
 
+from app.cli.exporter import write_csv_export, write_json_export
 from app.cli.widgets.header import RadiantHeader
 
 
@@ -38,6 +38,7 @@ class ExportScreen(Screen):
                         RadioButton("CSV (multiple files)", id="format-csv"),
                         id="format-select"
                     ),
+                    Checkbox("Compress (gzip)", id="compress"),
                     classes="question-group"
                 ),
 
@@ -65,12 +66,11 @@ class ExportScreen(Screen):
         yield Footer()
 
     def _do_export(self) -> None:
-        """Perform the export."""
-        db = self.app.db
-
+        """Read the export options and start the export in the background."""
         # Get format
         format_set = self.query_one("#format-select", RadioSet)
         export_json = format_set.pressed_index == 0
+        compress = self.query_one("#compress", Checkbox).value
 
         # Get output directory
         output_dir_input = self.query_one("#output-dir", Input)
@@ -79,42 +79,47 @@ class ExportScreen(Screen):
         status = self.query_one("#export-status", Static)
         status.update("[yellow]Exporting...[/]")
 
+        self._run_export(export_json, compress, output_dir, status)
+
+    @work(thread=True, exclusive=True)
+    def _run_export(self, export_json: bool, compress: bool, output_dir: Path, status: Static) -> None:
+        """Perform the export on a worker thread so the UI keeps responding."""
+        def report(message: str, notice: str = "", severity: str = "information") -> None:
+            self.app.call_from_thread(status.update, message)
+            if notice:
+                self.app.call_from_thread(self.notify, notice, severity=severity)
+
+        def on_table(key: str) -> None:
+            report(f"[yellow]Exporting... {key}[/]")
+
+        db = None
         try:
-            data = db.export_all()
+            # The app's connection belongs to the UI thread
+            db = self.app.db.open_copy()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_dir.mkdir(parents=True, exist_ok=True)
 
             if export_json:
-                output_path = output_dir / f"radiant_export_{timestamp}.json"
-                with open(output_path, "w") as f:
-                    json.dump(data, f, indent=2, default=str)
-                status.update(f"[green]Exported to {output_path}[/]")
-                self.notify(f"Exported to {output_path}")
+                suffix = ".json.gz" if compress else ".json"
+                output_path = output_dir / f"radiant_export_{timestamp}{suffix}"
+                write_json_export(db, output_path, on_table=on_table, compress=compress)
+                report(f"[green]Exported to {output_path}[/]", f"Exported to {output_path}")
             else:
                 export_dir = output_dir / f"radiant_export_{timestamp}"
                 export_dir.mkdir(parents=True, exist_ok=True)
 
-                files_created = []
-                for key, items in data.items():
-                    if items and isinstance(items, list) and len(items) > 0:
-                        csv_path = export_dir / f"{key}.csv"
-                        fieldnames = list(items[0].keys())
-                        with open(csv_path, "w", newline="") as f:
-                            writer = csv.DictWriter(f, fieldnames=fieldnames)
-                            writer.writeheader()
-                            for item in items:
-                                writer.writerow({
-                                    k: str(v) if v is not None else ""
-                                    for k, v in item.items()
-                                })
-                        files_created.append(key)
-
-                status.update(f"[green]Exported {len(files_created)} files to {export_dir}/[/]")
-                self.notify(f"Exported to {export_dir}/")
+                files_created = write_csv_export(db, export_dir, on_table=on_table, compress=compress)
+
+                report(
+                    f"[green]Exported {len(files_created)} files to {export_dir}/[/]",
+                    f"Exported to {export_dir}/",
+                )
 
         except Exception as e:
-            status.update(f"[red]Error: {e}[/]")
-            self.notify(f"Export failed: {e}", severity="error")
+            report(f"[red]Error: {e}[/]", f"Export failed: {e}", severity="error")
+        finally:
+            if db:
+                db.close()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -1,12 +1,15 @@
 """Home dashboard screen - Compact layout."""
 
+from datetime import date
+from functools import lru_cache
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.binding import Binding
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Grid
+from textual.containers import Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Static, Footer, Button
 
-from app.cli.widgets.header import RadiantHeader, MiniHeader
+from app.cli.widgets.header import MiniHeader
 
 
 # Financial level definitions
@@ -19,6 +22,30 @@ LEVELS = {
     5: ("Fat FIRE", "#f778ba", "Abundant freedom"),
 }
 
+# Metric style -> value color on a MetricCard
+METRIC_COLORS = {
+    "positive": "#3fb950",
+    "negative": "#f85149",
+    "warning": "#d29922",
+    "neutral": "#00d26a",
+}
+
+# Level -> progress bar, one filled block per level reached
+LEVEL_BARS = [("█" * (level + 1), "░" * (5 - level)) for level in range(6)]
+
+# Task priority -> bullet color in the tasks list
+PRIORITY_COLORS = {"high": "red", "medium": "yellow", "low": "dim"}
+
+# List row markup; the precision truncates the title or name
+_TASK_ROW = "[{color}]●[/] {title:.25} [dim]{due}[/]".format
+_EXPENSE_ROW = "{name:.20} [#00d26a]${amount:,.0f}[/] [dim]{due}[/]".format
+
+
+@lru_cache(maxsize=256)
+def _fmt_date(d: date, fmt: str) -> str:
+    """Format a date; the same few due dates come up on every refresh."""
+    return d.strftime(fmt)
+
 
 class HomeScreen(Screen):
     """Home dashboard showing financial overview."""
@@ -65,71 +92,80 @@ class HomeScreen(Screen):
         yield Footer()
 
     async def on_mount(self) -> None:
-        """Load data when screen mounts."""
+        """Look up the widgets refreshes update, then load data."""
+        self._metrics = {card.id: card for card in self.query(MetricCard)}
+        self._level_indicator = self.query_one("#level-indicator", LevelIndicator)
+        self._tasks_list = self.query_one("#tasks-list", Vertical)
+        self._expenses_list = self.query_one("#expenses-list", Vertical)
         await self._refresh_data()
 
     async def _refresh_data(self) -> None:
         """Refresh all dashboard data."""
         db = self.app.db
 
-        # Load data
-        assets = db.get_assets()
-        liabilities = db.get_liabilities()
-        tasks = db.get_upcoming_tasks(days=7)
-        expenses = db.get_upcoming_expenses(days=30)
+        # Load totals, and only the rows the lists show
+        totals = db.get_totals(task_days=7, expense_days=30)
+        tasks = db.get_upcoming_tasks(days=7, limit=4)
+        expenses = db.get_upcoming_expenses(days=30, limit=4)
         user_profile = db.get_user_profile()
 
-        # Calculate totals
-        total_assets = sum(a.value for a in assets)
-        total_debt = sum(l.balance for l in liabilities)
+        total_assets = totals["total_assets"]
+        total_debt = totals["total_debt"]
         net_worth = total_assets - total_debt
-        total_expenses = sum(e.amount for e in expenses)
-
-        # Update level indicator
-        level = user_profile.current_level if user_profile else 0
-        try:
-            level_indicator = self.query_one("#level-indicator", LevelIndicator)
-            level_indicator.update_level(level)
-        except Exception:
-            pass
-
-        # Update metrics
-        self._update_metric("net-worth", f"${net_worth:,.0f}", "positive" if net_worth >= 0 else "negative")
-        self._update_metric("assets", f"${total_assets:,.0f}", "neutral")
-        self._update_metric("debt", f"${total_debt:,.0f}", "negative" if total_debt > 0 else "neutral")
-        self._update_metric("tasks-count", str(len(tasks)), "warning" if tasks else "neutral")
-        self._update_metric("expenses-due", f"${total_expenses:,.0f}", "neutral")
-
-        # Update tasks list
-        tasks_list = self.query_one("#tasks-list", Vertical)
-        tasks_list.remove_children()
-
-        if tasks:
-            for task in tasks[:4]:
-                due = task.due_date.strftime("%m/%d") if task.due_date else ""
-                color = {"high": "red", "medium": "yellow", "low": "dim"}.get(task.priority.value, "")
-                tasks_list.mount(Static(f"[{color}]●[/] {task.title[:25]} [dim]{due}[/]", classes="list-item"))
-        else:
-            tasks_list.mount(Static("[dim]No tasks[/]", classes="empty-state"))
-
-        # Update expenses list
-        expenses_list = self.query_one("#expenses-list", Vertical)
-        expenses_list.remove_children()
-
-        if expenses:
-            for exp in expenses[:4]:
-                due = exp.due_date.strftime("%m/%d")
-                expenses_list.mount(Static(f"{exp.name[:20]} [#00d26a]${exp.amount:,.0f}[/] [dim]{due}[/]", classes="list-item"))
-        else:
-            expenses_list.mount(Static("[dim]No expenses[/]", classes="empty-state"))
+        total_expenses = totals["total_expenses"]
+
+        # Apply all widget updates in one screen refresh
+        with self.app.batch_update():
+            # Update level indicator
+            level = user_profile.current_level if user_profile else 0
+            self._level_indicator.update_level(level)
+
+            # Update metrics
+            self._update_metric("net-worth", f"${net_worth:,.0f}", "positive" if net_worth >= 0 else "negative")
+            self._update_metric("assets", f"${total_assets:,.0f}", "neutral")
+            self._update_metric("debt", f"${total_debt:,.0f}", "negative" if total_debt > 0 else "neutral")
+            self._update_metric("tasks-count", str(totals["task_count"]), "warning" if tasks else "neutral")
+            self._update_metric("expenses-due", f"${total_expenses:,.0f}", "neutral")
+
+            # Update tasks list
+            tasks_list = self._tasks_list
+            tasks_list.remove_children()
+
+            if tasks:
+                tasks_list.mount_all([
+                    Static(
+                        _TASK_ROW(
+                            color=PRIORITY_COLORS.get(task.priority.value, ""),
+                            title=task.title,
+                            due=_fmt_date(task.due_date, "%m/%d") if task.due_date else "",
+                        ),
+                        classes="list-item"
+                    )
+                    for task in tasks
+                ])
+            else:
+                tasks_list.mount(Static("[dim]No tasks[/]", classes="empty-state"))
+
+            # Update expenses list
+            expenses_list = self._expenses_list
+            expenses_list.remove_children()
+
+            if expenses:
+                expenses_list.mount_all([
+                    Static(
+                        _EXPENSE_ROW(name=exp.name, amount=exp.amount, due=_fmt_date(exp.due_date, "%m/%d")),
+                        classes="list-item"
+                    )
+                    for exp in expenses
+                ])
+            else:
+                expenses_list.mount(Static("[dim]No expenses[/]", classes="empty-state"))
 
     def _update_metric(self, metric_id: str, value: str, style: str = "neutral") -> None:
         """Update a metric card value."""
-        try:
-            card = self.query_one(f"#{metric_id}", MetricCard)
+        card = self._metrics.get(metric_id)
+        if card:
             card.update_value(value, style)
-        except Exception:
-            pass
 
     async def action_refresh(self) -> None:
         await self._refresh_data()
@@ -185,20 +221,19 @@ class MetricCard(Static):
         self.label = label
         self.value = value
         self.style_type = "neutral"
+        self._rendered = self._build()
 
-    def render(self) -> str:
-        colors = {
-            "positive": "#3fb950",
-            "negative": "#f85149",
-            "warning": "#d29922",
-            "neutral": "#00d26a"
-        }
-        color = colors.get(self.style_type, "#00d26a")
+    def _build(self) -> str:
+        color = METRIC_COLORS.get(self.style_type, "#00d26a")
         return f"[#8b949e]{self.label}[/]\n[{color} bold]{self.value}[/]"
 
+    def render(self) -> str:
+        return self._rendered
+
     def update_value(self, value: str, style: str = "neutral") -> None:
         self.value = value
         self.style_type = style
+        self._rendered = self._build()
         self.refresh()
 
 
@@ -219,13 +254,13 @@ class LevelIndicator(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.level = 0
+        self._rendered = self._build()
 
-    def render(self) -> str:
+    def _build(self) -> str:
         name, color, desc = LEVELS.get(self.level, LEVELS[0])
 
         # Create level progress bar
-        filled = "█" * (self.level + 1)
-        empty = "░" * (5 - self.level)
+        filled, empty = LEVEL_BARS[self.level]
         progress = f"[{color}]{filled}[/][#21262d]{empty}[/]"
 
         # Level badge
@@ -233,6 +268,10 @@ class LevelIndicator(Static):
 
         return f"{badge} [{color}]{name}[/]  {progress}  [dim]{desc}[/]"
 
+    def render(self) -> str:
+        return self._rendered
+
     def update_level(self, level: int) -> None:
         self.level = max(0, min(5, level))
+        self._rendered = self._build()
         self.refresh()
@@ -1,16 +1,136 @@
 """Tasks screen for managing financial tasks."""
 
-from datetime import date, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from threading import Lock
+from typing import Optional
+from uuid import UUID
+
+from rich.text import Text
+from textual import events, work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.binding import Binding
+from textual.message import Message
+from textual.timer import Timer
+from textual.worker import get_current_worker
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Static, Footer, Button, Input, Label, Select, Checkbox
 
+from app.cli.screens.home import HomeScreen
 from app.cli.widgets.header import RadiantHeader
 from app.cli.widgets.currency_input import CurrencyInput
+from app.data.database import SecureDatabase
 from app.models import FinancialTask, TaskPriority, TaskCategory
 
+# Seconds to wait after a "Show completed" toggle before reloading
+_REFRESH_DELAY = 0.05
+
+# Task priority -> bullet color
+_PRIORITY_COLORS = {"high": "red", "medium": "yellow", "low": "dim"}
+
+# Completed -> style applied to the task title
+_COMPLETED_STYLE = {True: "strike dim", False: ""}
+
+# Completed -> check box drawn at the start of a row
+_CHECKBOX = {True: ("[x]", "#00d26a"), False: ("[ ]", "")}
+_CHECKBOX_WIDTH = 3
+
+# Delete control drawn at the end of a row
+_DELETE = " ✕"
+_DELETE_WIDTH = 1
+
+
+def _due_sort_key(task: FinancialTask) -> tuple[bool, date]:
+    """Sort key matching ORDER BY due_date, where undated tasks come first."""
+    return (task.due_date is not None, task.due_date or date.min)
+
+
+@lru_cache(maxsize=256)
+def _format_amount(amount: Optional[float]) -> str:
+    """Format a task amount for its row, or nothing if there is none."""
+    return f" ${amount:,.2f}" if amount else ""
+
+
+@lru_cache(maxsize=256)
+def _format_due(due_date: Optional[date]) -> str:
+    """Format a task due date for its row."""
+    return due_date.strftime("%b %d") if due_date else "No date"
+
+
+def _parse_iso_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD date, returning None if it is not one."""
+    # Reject the wrong shape without raising; fromisoformat checks the rest
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class TaskRow(Static, can_focus=True):
+    """
+    A task list row drawn as a single line of text.
+
+    Clicking the leading box (or pressing space) completes the task and
+    clicking the trailing cross (or pressing delete) removes it; both are
+    reported to the screen as messages.
+    """
+
+    BINDINGS = [
+        Binding("space", "complete", "Complete", show=False),
+        Binding("delete", "delete", "Delete", show=False),
+    ]
+
+    class Completed(Message):
+        """Posted when the user completes the row's task."""
+
+        def __init__(self, task_id: UUID) -> None:
+            super().__init__()
+            self.task_id = task_id
+
+    class Deleted(Message):
+        """Posted when the user deletes the row's task."""
+
+        def __init__(self, task_id: UUID) -> None:
+            super().__init__()
+            self.task_id = task_id
+
+    def __init__(self, task: FinancialTask, text: Text) -> None:
+        super().__init__(text, id=f"task-{task.id}", classes="list-item")
+        self.task_id = task.id
+        self.completed = task.completed
+        self.task_text = text
+
+    def set_task(self, task: FinancialTask, text: Text) -> None:
+        """Show a task's latest state, redrawing only if its text changed."""
+        self.completed = task.completed
+        if text is not self.task_text:
+            self.task_text = text
+            self.update(text)
+
+    def on_click(self, event: events.Click) -> None:
+        # Hit-test against the text as laid out in the content region, so
+        # padding, borders and wrapped lines are accounted for
+        offset = event.get_content_offset(self)
+        if offset is None:
+            return
+        lines = self.task_text.wrap(self.app.console, self.content_size.width)
+        last_width = lines[-1].cell_len
+        if offset.y == 0 and offset.x < _CHECKBOX_WIDTH:
+            self.action_complete()
+        elif offset.y == len(lines) - 1 and last_width - _DELETE_WIDTH <= offset.x < last_width:
+            self.action_delete()
+
+    def action_complete(self) -> None:
+        if not self.completed:
+            self.post_message(self.Completed(self.task_id))
+
+    def action_delete(self) -> None:
+        self.post_message(self.Deleted(self.task_id))
+
 
 class TasksScreen(Screen):
     """Screen for managing financial tasks and reminders."""
@@ -25,6 +145,16 @@ class TasksScreen(Screen):
         super().__init__()
         self.tasks = []
         self.show_completed = False
+        # Row text per task, keyed by the fields it shows
+        self._row_cache: dict[UUID, tuple[tuple, Text]] = {}
+        # Mounted row per task, patched in place on refresh
+        self._row_widgets: dict[UUID, TaskRow] = {}
+        # Pending reload after a "Show completed" toggle
+        self._refresh_timer: Optional[Timer] = None
+        # Connection shared by the loading workers, opened on first use;
+        # the lock keeps a cancelled worker and its successor off it at once
+        self._worker_db: Optional[SecureDatabase] = None
+        self._worker_db_lock = Lock()
 
     def compose(self) -> ComposeResult:
         yield Container(
@@ -110,56 +240,118 @@ class TasksScreen(Screen):
         )
         yield Footer()
 
-    async def on_mount(self) -> None:
+    def on_mount(self) -> None:
         """Load existing tasks."""
-        await self._refresh_list()
+        self._refresh_list()
 
-    async def _refresh_list(self) -> None:
-        """Refresh the tasks list."""
-        db = self.app.db
-        self.tasks = db.get_tasks(include_completed=self.show_completed)
+    def on_unmount(self) -> None:
+        """Close the workers' connection."""
+        with self._worker_db_lock:
+            if self._worker_db is not None:
+                self._worker_db.close()
+                self._worker_db = None
+
+    @work(thread=True, exclusive=True)
+    def _refresh_list(self) -> None:
+        """Load tasks on a worker thread, then refresh the list on the UI thread."""
+        worker = get_current_worker()
+        include_completed = self.show_completed
+
+        # The app's connection belongs to the UI thread, so workers keep one
+        # of their own instead of keying a new connection per refresh
+        with self._worker_db_lock:
+            if worker.is_cancelled or not self.is_attached:
+                return
+            if self._worker_db is None:
+                self._worker_db = self.app.db.open_copy(check_same_thread=False)
+            tasks = self._worker_db.get_tasks(include_completed=include_completed)
 
-        tasks_list = self.query_one("#tasks-list", Vertical)
-        tasks_list.remove_children()
+        # Row text is built on the UI thread, which owns the row cache
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self._show_tasks, tasks)
 
-        if self.tasks:
-            for task in self.tasks:
-                due_str = task.due_date.strftime("%b %d") if task.due_date else "No date"
-                priority_color = {
-                    "high": "red",
-                    "medium": "yellow",
-                    "low": "dim"
-                }.get(task.priority.value, "white")
+    async def _show_tasks(self, tasks: list[FinancialTask]) -> None:
+        """Replace the listed tasks with freshly loaded ones."""
+        self.tasks = tasks
+        await self._render_tasks()
 
-                completed_style = "[strike dim]" if task.completed else ""
-                completed_end = "[/]" if task.completed else ""
+    async def _render_tasks(self) -> None:
+        """Bring the list up to date with self.tasks, without touching the database."""
+        tasks_list = self.query_one("#tasks-list", Vertical)
+        current_ids = {task.id for task in self.tasks}
+
+        # Patch only the rows that changed, in one screen update
+        with self.app.batch_update():
+            stale = [row for task_id, row in self._row_widgets.items() if task_id not in current_ids]
+            self._row_widgets = {
+                task_id: row for task_id, row in self._row_widgets.items() if task_id in current_ids
+            }
+            if stale:
+                await tasks_list.remove_children(stale)
+
+            if not self.tasks:
+                if not tasks_list.query(".empty-state"):
+                    tasks_list.mount(
+                        Static("No tasks. Add one below.", classes="empty-state")
+                    )
+            else:
+                await tasks_list.query(".empty-state").remove()
+
+                # Rows already shown stay in due-date order, since due dates
+                # are not edited here; new rows go in after their predecessor
+                previous = None
+                for task in self.tasks:
+                    row = self._row_widgets.get(task.id)
+                    if row is None:
+                        row = self._row_widgets[task.id] = self._task_row(task)
+                        if previous is not None:
+                            tasks_list.mount(row, after=previous)
+                        elif tasks_list.children:
+                            tasks_list.mount(row, before=0)
+                        else:
+                            tasks_list.mount(row)
+                    else:
+                        self._update_task_row(row, task)
+                    previous = row
+
+        # Drop cached text for tasks no longer listed
+        self._row_cache = {task.id: self._row_cache[task.id] for task in self.tasks}
+
+    def _task_text(self, task: FinancialTask) -> Text:
+        """Build a task's row text, reusing the earlier result if nothing it shows changed."""
+        key = (task.completed, task.priority, task.title, task.category, task.amount, task.due_date)
+        cached = self._row_cache.get(task.id)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        priority_color = _PRIORITY_COLORS.get(task.priority.value, "white")
+
+        # Styled spans are assembled directly, so no markup is parsed
+        text = Text.assemble(
+            _CHECKBOX[task.completed],
+            " ",
+            ("●", priority_color),
+            " ",
+            (task.title, _COMPLETED_STYLE[task.completed]),
+            "  ",
+            (task.category.value, "dim"),
+            (_format_amount(task.amount), "#00d26a"),
+            "  ",
+            (_format_due(task.due_date), "dim"),
+            (_DELETE, "red"),
+        )
+        self._row_cache[task.id] = (key, text)
+        return text
 
-                amount_str = f" ${task.amount:,.2f}" if task.amount else ""
+    def _task_row(self, task: FinancialTask) -> TaskRow:
+        """Build the list row for a single task."""
+        return TaskRow(task, self._task_text(task))
 
-                tasks_list.mount(
-                    Horizontal(
-                        Checkbox(
-                            "",
-                            value=task.completed,
-                            id=f"complete-{task.id}"
-                        ),
-                        Static(
-                            f"[{priority_color}]●[/] {completed_style}{task.title}{completed_end}",
-                            classes="list-item-title"
-                        ),
-                        Static(f"[dim]{task.category.value}[/]"),
-                        Static(f"[#00d26a]{amount_str}[/]", classes="list-item-amount"),
-                        Static(f"[dim]{due_str}[/]", classes="list-item-date"),
-                        Button("X", id=f"delete-{task.id}", classes="btn-delete"),
-                        classes="list-item"
-                    )
-                )
-        else:
-            tasks_list.mount(
-                Static("No tasks. Add one below.", classes="empty-state")
-            )
+    def _update_task_row(self, row: TaskRow, task: FinancialTask) -> None:
+        """Bring an existing row up to date with its task, if anything changed."""
+        row.set_task(task, self._task_text(task))
 
-    def _add_task(self) -> None:
+    async def _add_task(self) -> None:
         """Add a new task from form data."""
         title_input = self.query_one("#new-task-title", Input)
         category_select = self.query_one("#new-task-category", Select)
@@ -179,9 +371,8 @@ class TasksScreen(Screen):
         due_date = None
         date_str = date_input.value.strip()
         if date_str:
-            try:
-                due_date = date.fromisoformat(date_str)
-            except ValueError:
+            due_date = _parse_iso_date(date_str)
+            if due_date is None:
                 self.notify("Invalid date format. Use YYYY-MM-DD", severity="warning")
                 return
 
@@ -202,6 +393,10 @@ class TasksScreen(Screen):
         db = self.app.db
         db.save_task(task)
 
+        # Keep self.tasks in the database's order: undated first, then by due date
+        index = bisect_right(self.tasks, _due_sort_key(task), key=_due_sort_key)
+        self.tasks.insert(index, task)
+
         # Clear form
         title_input.value = ""
         category_select.value = "other"
@@ -210,9 +405,13 @@ class TasksScreen(Screen):
         amount_input.value = ""
 
         self.notify(f"Added task: {title}")
-        self._refresh_list()
+        await self._render_tasks()
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+    def _find_task(self, task_id: UUID) -> Optional[FinancialTask]:
+        """Find a listed task by id."""
+        return next((task for task in self.tasks if task.id == task_id), None)
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         button_id = event.button.id
 
@@ -221,35 +420,41 @@ class TasksScreen(Screen):
         elif button_id == "btn-finish":
             self.notify("Check-in complete!", title="Success")
             # Go back to home
-            from app.cli.screens.home import HomeScreen
             self.app.switch_screen(HomeScreen())
         elif button_id == "btn-add-task":
-            self._add_task()
-        elif button_id and button_id.startswith("delete-"):
-            task_id = button_id.replace("delete-", "")
-            from uuid import UUID
-            # Delete task (we'd need to implement this)
-            self.notify("Task deleted")
-            self._refresh_list()
+            await self._add_task()
 
-    def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
+    async def on_checkbox_changed(self, event: Checkbox.Changed) -> None:
         """Handle checkbox changes."""
         checkbox_id = event.checkbox.id
 
         if checkbox_id == "show-completed":
             self.show_completed = event.value
-            self._refresh_list()
-        elif checkbox_id and checkbox_id.startswith("complete-"):
-            task_id = checkbox_id.replace("complete-", "")
-            from uuid import UUID
-            db = self.app.db
-
-            if event.value:
-                db.complete_task(UUID(task_id))
-                self.notify("Task completed!")
-            # For uncomplete, we'd need to implement that
-
-            self._refresh_list()
+            # Coalesce rapid toggles into a single reload
+            if self._refresh_timer:
+                self._refresh_timer.stop()
+            self._refresh_timer = self.set_timer(_REFRESH_DELAY, self._refresh_list)
+
+    async def on_task_row_completed(self, message: TaskRow.Completed) -> None:
+        """Complete a task from its row."""
+        task = self._find_task(message.task_id)
+        if task:
+            self.app.db.complete_task(task.id)
+            task.completed = True
+            task.completed_at = datetime.now()
+            if not self.show_completed:
+                self.tasks.remove(task)
+            self.notify("Task completed!")
+            await self._render_tasks()
+
+    async def on_task_row_deleted(self, message: TaskRow.Deleted) -> None:
+        """Delete a task from its row."""
+        task = self._find_task(message.task_id)
+        if task:
+            self.app.db.delete_task(task.id)
+            self.tasks.remove(task)
+            self.notify("Task deleted")
+            await self._render_tasks()
 
     def action_go_back(self) -> None:
         """Go back to previous screen."""
@@ -258,7 +463,6 @@ class TasksScreen(Screen):
     def action_save_and_finish(self) -> None:
         """Finish check-in."""
         self.notify("Check-in complete!", title="Success")
-        from app.cli.screens.home import HomeScreen
         self.app.switch_screen(HomeScreen())
 
     def action_add_task(self) -> None:
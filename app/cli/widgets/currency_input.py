@@ -4,6 +4,13 @@ from textual.widgets import Input
 from textual.validation import Validator, ValidationResult
 import re
 
+_DIGITS = frozenset("0123456789")
+_SIGNS = frozenset("+-")
+_SKIPPED = frozenset("$,")
+
+# Deletes currency symbols and thousands separators in one pass
+_STRIP_TABLE = str.maketrans("", "", "$,")
+
 
 class CurrencyValidator(Validator):
     """Validator for currency inputs."""
@@ -13,15 +20,29 @@ class CurrencyValidator(Validator):
         if not value:
             return self.success()
 
-        # Remove currency symbols and commas
-        cleaned = value.replace("$", "").replace(",", "").strip()
-
-        # Check if it's a valid number
-        try:
-            float(cleaned)
-            return self.success()
-        except ValueError:
-            return self.failure("Please enter a valid amount")
+        # One pass: skip currency symbols and commas, allow surrounding
+        # whitespace, a leading sign, digits and at most one decimal point
+        seen_digit = seen_dot = started = trailing = False
+        for ch in value:
+            if ch in _SKIPPED:
+                continue
+            if ch.isspace():
+                trailing = started
+                continue
+            if trailing:
+                break
+            if ch in _DIGITS:
+                seen_digit = True
+            elif ch == "." and not seen_dot:
+                seen_dot = True
+            elif ch not in _SIGNS or started:
+                break
+            started = True
+        else:
+            if seen_digit:
+                return self.success()
+
+        return self.failure("Please enter a valid amount")
 
 
 class CurrencyInput(Input):
@@ -57,20 +78,30 @@ class CurrencyInput(Input):
             validators=[CurrencyValidator()],
             **kwargs
         )
+        # Last (raw value, parsed amount) returned by get_value
+        self._parsed: tuple[str, float] | None = None
 
     def get_value(self) -> float:
         """Get the numeric value of the input."""
-        if not self.value:
+        raw = self.value
+        if not raw:
             return 0.0
 
+        if self._parsed and self._parsed[0] == raw:
+            return self._parsed[1]
+
         # Remove currency symbols and commas
-        cleaned = self.value.replace("$", "").replace(",", "").strip()
+        cleaned = raw.translate(_STRIP_TABLE).strip()
 
         try:
-            return float(cleaned)
+            amount = float(cleaned)
         except ValueError:
-            return 0.0
+            amount = 0.0
+
+        self._parsed = (raw, amount)
+        return amount
 
     def set_value(self, amount: float) -> None:
         """Set the input value from a float."""
+        self._parsed = None
         self.value = f"{amount:,.2f}"
@@ -14,6 +14,10 @@ MINI_BANNER = "[#00d26a bold]RADIANT[/] [dim]Money Manager[/]"
 
 TAGLINE = "[dim]See your money clearly.[/]"
 
+# Rendered header text, built once rather than on every repaint
+_BANNER_WITH_TAGLINE = f"{BANNER}\n{TAGLINE}"
+_MINI_WITH_TAGLINE = f"{MINI_BANNER}  {TAGLINE}"
+
 
 class RadiantHeader(Static):
     """Full Radiant banner header with gradient colors."""
@@ -26,13 +30,8 @@ class RadiantHeader(Static):
     """
 
     def __init__(self, show_tagline: bool = True):
-        super().__init__()
-        self.show_tagline = show_tagline
-
-    def render(self) -> str:
-        if self.show_tagline:
-            return f"{BANNER}\n{TAGLINE}"
-        return BANNER
+        # Static keeps this as its content, so there is no render() to run
+        super().__init__(_BANNER_WITH_TAGLINE if show_tagline else BANNER)
 
 
 class MiniHeader(Static):
@@ -47,5 +46,5 @@ class MiniHeader(Static):
     }
     """
 
-    def render(self) -> str:
-        return f"{MINI_BANNER}  {TAGLINE}"
+    def __init__(self, **kwargs):
+        super().__init__(_MINI_WITH_TAGLINE, **kwargs)
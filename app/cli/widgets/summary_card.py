@@ -3,6 +3,13 @@
 from textual.widgets import Static
 from textual.containers import Vertical
 
+# value_type -> markup wrapped around the card value
+_VALUE_STYLES = {
+    "positive": ("[green]", "[/]"),
+    "negative": ("[red]", "[/]"),
+    "neutral": ("[#00d26a]", "[/]"),
+}
+
 
 class SummaryCard(Static):
     """A card displaying a financial summary metric."""
@@ -58,18 +65,10 @@ class SummaryCard(Static):
         self.card_value = value
         self.card_subtitle = subtitle
         self.value_type = value_type
+        self._cached = self._build()
 
-    def render(self) -> str:
-        value_class = ""
-        if self.value_type == "positive":
-            value_class = "[green]"
-            value_end = "[/]"
-        elif self.value_type == "negative":
-            value_class = "[red]"
-            value_end = "[/]"
-        else:
-            value_class = "[#00d26a]"
-            value_end = "[/]"
+    def _build(self) -> str:
+        value_class, value_end = _VALUE_STYLES.get(self.value_type, _VALUE_STYLES["neutral"])
 
         lines = [
             f"[#8b949e]{self.card_title}[/]",
@@ -81,8 +80,12 @@ class SummaryCard(Static):
 
         return "\n".join(lines)
 
+    def render(self) -> str:
+        return self._cached
+
     def update_value(self, value: str, value_type: str = "neutral") -> None:
         """Update the card's value."""
         self.card_value = value
         self.value_type = value_type
+        self._cached = self._build()
         self.refresh()
@@ -1,11 +1,17 @@
 """
 Application configuration constants.
 Centralizes all magic numbers and configurable values for easy maintenance.
+
+Environment variables are read once, when this module is imported, and stored
+as plain fields. Keep it that way: if a computed value is ever needed, wrap its
+accessor in functools.cache rather than reading the environment on each call.
 """
 import os
+from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass(frozen=True, slots=True)
 class FinancialConfig:
     """Financial calculation constants and thresholds."""
     
@@ -100,8 +106,9 @@ class FinancialConfig:
     DAYS_PER_MONTH: int = 30
 
 
+@dataclass(frozen=True, slots=True)
 class RateLimitConfig:
-    """Rate limiting configuration."""
+    """Rate limiting configuration, read from the environment at import."""
     
     # Maximum requests per window
     REQUESTS_PER_WINDOW: int = int(os.environ.get("RATE_LIMIT_REQUESTS", "100"))
@@ -110,6 +117,7 @@ class RateLimitConfig:
     WINDOW_SECONDS: int = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))
 
 
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """General application configuration."""
     
@@ -131,8 +139,9 @@ class AppConfig:
     COOKIE_MAX_AGE: int = 3600  # 1 hour for onboarding cookies
 
 
+@dataclass(frozen=True, slots=True)
 class LogConfig:
-    """Logging configuration."""
+    """Logging configuration, read from the environment at import."""
     
     # Log level (from environment or default)
     LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
@@ -148,7 +157,8 @@ class LogConfig:
 # CONVENIENCE EXPORTS
 # =============================================================================
 
-# Financial constants (most commonly used)
+# Financial constants (most commonly used). Each config is a frozen, slotted
+# instance, so values are read from fixed slots and cannot be reassigned.
 FINANCIAL = FinancialConfig()
 RATE_LIMIT = RateLimitConfig()
 APP = AppConfig()
@@ -2,8 +2,11 @@
 Logging configuration for the application.
 Provides structured logging with appropriate levels for different environments.
 """
+import atexit
 import logging
 import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from queue import Empty, SimpleQueue
 from typing import Optional
 
 # =============================================================================
@@ -17,6 +20,42 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Log level from environment (default: INFO)
 DEFAULT_LOG_LEVEL = "INFO"
 
+# Records held before a batched write; WARNING and above write at once
+LOG_BUFFER_CAPACITY = 1024
+
+# Seconds a record may wait in the buffer: it is written once the oldest
+# buffered record is this old, or once no record has arrived for this long
+LOG_FLUSH_INTERVAL = 1.0
+
+
+class _TimedMemoryHandler(MemoryHandler):
+    """MemoryHandler that also flushes once its oldest record is LOG_FLUSH_INTERVAL old."""
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        return (
+            super().shouldFlush(record)
+            or record.created - self.buffer[0].created >= LOG_FLUSH_INTERVAL
+        )
+
+
+class _IdleFlushQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue goes quiet."""
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if not block:
+            return self.queue.get(block=False)
+        try:
+            return self.queue.get(timeout=LOG_FLUSH_INTERVAL)
+        except Empty:
+            # Nothing new is coming for now, so don't sit on buffered records
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get()
+
+
+# Background thread writing queued records to stdout
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: Optional[str] = None,
@@ -26,6 +65,12 @@ def setup_logging(
     """
     Configure application-wide logging.
     
+    Records are queued by the logging thread and written to stdout by a
+    background listener, so logging calls never wait on terminal I/O.
+    The listener buffers records below WARNING and writes them in batches;
+    a WARNING or worse writes out the buffer along with itself, and no
+    record waits more than about LOG_FLUSH_INTERVAL seconds.
+    
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Format string for log messages
@@ -36,19 +81,35 @@ def setup_logging(
     """
     import os
     
+    global _listener
+    
     # Get log level from environment or use default
     log_level = level or os.environ.get("LOG_LEVEL", DEFAULT_LOG_LEVEL)
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level,
-        format=log_format,
-        datefmt=date_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Configure root logger, unless something already has
+    if _listener is None and not logging.getLogger().handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(log_format, date_format))
+        buffered_handler = _TimedMemoryHandler(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=stream_handler,
+            flushOnClose=True,
+        )
+        
+        queue = SimpleQueue()
+        _listener = _IdleFlushQueueListener(queue, buffered_handler, respect_handler_level=True)
+        _listener.start()
+        # atexit runs last-registered first: drain the queue, then flush the buffer
+        atexit.register(buffered_handler.close)
+        atexit.register(_listener.stop)
+        
+        # The queue handler only merges args into the message; the stream
+        # handler applies the real format on the listener thread
+        queue_handler = QueueHandler(queue)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=numeric_level, handlers=[queue_handler])
     
     # Create application logger
     logger = logging.getLogger("radiant")
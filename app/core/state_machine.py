@@ -4,18 +4,36 @@ Finite State Machine for onboarding flow.
 Provides robust server-side state management for the onboarding process,
 replacing the fragile cookie-based approach.
 """
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Optional, Dict, Any
 from datetime import datetime
 from uuid import uuid4
-from pydantic import BaseModel, Field
+import atexit
 import json
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 from app.core.logging import get_logger
+from app.domain.metrics import calculate_financial_level
 
 logger = get_logger("state_machine")
 
+# Minimum seconds between writes of one session; updates inside the window
+# are coalesced into a single deferred write of the latest state
+PERSIST_INTERVAL = 0.1
+
+# Sessions kept in memory when file storage is configured; the least
+# recently used beyond this are dropped and reloaded from their files.
+# Without file storage nothing is evicted, since an evicted session could
+# not be reloaded and its user would silently start over; memory then grows
+# with the number of live sessions.
+MAX_SESSIONS = 1000
+
 
 class OnboardingState(str, Enum):
     """States in the onboarding flow."""
@@ -29,7 +47,8 @@ class OnboardingState(str, Enum):
     COMPLETED = "completed"
 
 
-class OnboardingData(BaseModel):
+@dataclass(slots=True)
+class OnboardingData:
     """Data collected during onboarding."""
     income: Optional[float] = None
     burn: Optional[float] = None
@@ -39,21 +58,44 @@ class OnboardingData(BaseModel):
     calculated_level: Optional[int] = None
 
 
-class OnboardingSession(BaseModel):
+@dataclass(slots=True)
+class OnboardingSession:
     """
     Complete onboarding session state.
     
-    Stores both the current state and all collected data.
+    Stores both the current state and all collected data. Inputs are
+    validated by the HTTP layer, so sessions are plain slotted dataclasses.
     """
-    id: str = Field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: str(uuid4()))
     state: OnboardingState = OnboardingState.WELCOME
-    data: OnboardingData = Field(default_factory=OnboardingData)
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    data: OnboardingData = field(default_factory=OnboardingData)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    
+    def to_json(self) -> str:
+        """Serialize the session for file storage."""
+        return json.dumps({
+            "id": self.id,
+            "state": self.state.value,
+            "data": asdict(self.data),
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        })
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OnboardingSession":
+        """Rebuild a session from the dict form written by to_json()."""
+        return cls(
+            id=data["id"],
+            state=OnboardingState(data["state"]),
+            data=OnboardingData(**data.get("data", {})),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        )
     
     def transition(self, new_state: OnboardingState) -> None:
         """Transition to a new state."""
-        logger.info(f"Onboarding {self.id}: {self.state.value} -> {new_state.value}")
+        logger.info("Onboarding %s: %s -> %s", self.id, self.state.value, new_state.value)
         self.state = new_state
         self.updated_at = datetime.now()
     
@@ -98,8 +140,6 @@ class OnboardingSession(BaseModel):
     
     def _calculate_level(self) -> None:
         """Calculate the user's financial level based on collected data."""
-        from app.domain.metrics import calculate_financial_level
-        
         self.data.calculated_level = calculate_financial_level(
             monthly_income=self.data.income or 0.0,
             monthly_burn=self.data.burn or 0.0,
@@ -125,8 +165,9 @@ class OnboardingFSM:
     """
     Finite State Machine manager for onboarding sessions.
     
-    Handles session storage and retrieval with in-memory caching
-    and optional file persistence.
+    Handles session storage and retrieval with an in-memory cache and
+    optional file persistence. With file persistence the cache is an LRU
+    bounded by MAX_SESSIONS; without it every session stays in memory.
     """
     
     def __init__(self, storage_dir: Optional[Path] = None):
@@ -137,18 +178,24 @@ class OnboardingFSM:
             storage_dir: Optional directory for persistent storage.
                         If None, sessions are only stored in memory.
         """
-        self._sessions: Dict[str, OnboardingSession] = {}
+        self._sessions: OrderedDict[str, OnboardingSession] = OrderedDict()
         self._storage_dir = storage_dir
+        # Write coalescing: last write time and pending deferred write per session
+        self._last_persist: Dict[str, float] = {}
+        self._pending: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
         
         if storage_dir:
             storage_dir.mkdir(parents=True, exist_ok=True)
+            # Deferred writes run on daemon timers, which die with the process
+            atexit.register(self.flush)
     
     def create_session(self) -> OnboardingSession:
         """Create a new onboarding session."""
         session = OnboardingSession()
-        self._sessions[session.id] = session
+        self._cache_session(session)
         self._persist_session(session)
-        logger.info(f"Created new onboarding session: {session.id}")
+        logger.info("Created new onboarding session: %s", session.id)
         return session
     
     def get_session(self, session_id: str) -> Optional[OnboardingSession]:
@@ -157,14 +204,21 @@ class OnboardingFSM:
         
         First checks in-memory cache, then tries file storage.
         """
-        # Check memory cache
-        if session_id in self._sessions:
-            return self._sessions[session_id]
+        # Check memory cache without the lock: get() and move_to_end() are
+        # each atomic under the GIL, and only writers need to be serialized
+        session = self._sessions.get(session_id)
+        if session:
+            try:
+                self._sessions.move_to_end(session_id)
+            except KeyError:
+                # Evicted or deleted in between; it is still a valid read
+                pass
+            return session
         
         # Try loading from storage
         session = self._load_session(session_id)
         if session:
-            self._sessions[session_id] = session
+            self._cache_session(session)
         
         return session
     
@@ -186,34 +240,117 @@ class OnboardingFSM:
         return self.create_session()
     
     def update_session(self, session: OnboardingSession) -> None:
-        """Update a session in storage."""
-        session.updated_at = datetime.now()
-        self._sessions[session.id] = session
+        """
+        Update a session in storage.
+        
+        The session's updated_at is not stamped again here: every change
+        goes through transition(), which already stamped it this request.
+        """
+        self._cache_session(session)
         self._persist_session(session)
     
     def delete_session(self, session_id: str) -> None:
         """Delete a session from storage."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            timer = self._pending.pop(session_id, None)
+            self._last_persist.pop(session_id, None)
+        if timer:
+            timer.cancel()
         
         if self._storage_dir:
             file_path = self._storage_dir / f"{session_id}.json"
             if file_path.exists():
                 file_path.unlink()
         
-        logger.info(f"Deleted onboarding session: {session_id}")
+        logger.info("Deleted onboarding session: %s", session_id)
+    
+    def _cache_session(self, session: OnboardingSession) -> None:
+        """
+        Keep a session in memory as the most recently used.
+
+        With file storage the oldest sessions beyond MAX_SESSIONS are
+        evicted; they are reloaded from their files when next requested.
+        """
+        with self._lock:
+            self._sessions[session.id] = session
+            self._sessions.move_to_end(session.id)
+            while self._storage_dir and len(self._sessions) > MAX_SESSIONS:
+                old_id, old_session = self._sessions.popitem(last=False)
+                self._last_persist.pop(old_id, None)
+                timer = self._pending.pop(old_id, None)
+                if timer:
+                    # A deferred write would no longer find the session
+                    timer.cancel()
+                    self._write_session(old_session)
     
     def _persist_session(self, session: OnboardingSession) -> None:
-        """Persist session to file storage if configured."""
+        """
+        Persist session to file storage if configured.
+        
+        A session written less than PERSIST_INTERVAL ago is written again
+        once the interval has passed, with whatever state it has by then.
+        """
         if not self._storage_dir:
             return
         
+        # Writes happen under the lock and only for sessions still cached,
+        # so a write never recreates the file of a deleted session
+        with self._lock:
+            if session.id in self._pending:
+                # The deferred write will pick up this update
+                return
+            
+            wait = self._last_persist.get(session.id, 0.0) + PERSIST_INTERVAL - time.monotonic()
+            if wait > 0:
+                timer = threading.Timer(wait, self._flush_session, args=(session.id,))
+                timer.daemon = True
+                self._pending[session.id] = timer
+                timer.start()
+                return
+            
+            if session.id in self._sessions:
+                self._last_persist[session.id] = time.monotonic()
+                self._write_session(session)
+    
+    def _flush_session(self, session_id: str) -> None:
+        """Write a session whose persistence was deferred."""
+        with self._lock:
+            # Already flushed, evicted or deleted
+            if self._pending.pop(session_id, None) is None:
+                return
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._last_persist[session_id] = time.monotonic()
+                self._write_session(session)
+    
+    def flush(self) -> None:
+        """Write every session whose persistence is still deferred."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            for session_id, timer in pending.items():
+                timer.cancel()
+                session = self._sessions.get(session_id)
+                if session is not None:
+                    self._last_persist[session_id] = time.monotonic()
+                    self._write_session(session)
+    
+    def _write_session(self, session: OnboardingSession) -> None:
+        """Atomically replace a session's file with its current state; call with the lock held."""
         try:
             file_path = self._storage_dir / f"{session.id}.json"
-            with open(file_path, "w") as f:
-                json.dump(session.model_dump(mode="json"), f, default=str)
+            # Write a temp file beside the target, then rename it over the
+            # target, so readers never see a partly written session
+            fd, tmp_path = tempfile.mkstemp(dir=self._storage_dir, suffix=".json.tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(session.to_json())
+                os.replace(tmp_path, file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
         except Exception as e:
-            logger.error(f"Failed to persist session {session.id}: {e}")
+            logger.error("Failed to persist session %s: %s", session.id, e)
     
     def _load_session(self, session_id: str) -> Optional[OnboardingSession]:
         """Load session from file storage if it exists."""
@@ -228,9 +365,9 @@ class OnboardingFSM:
             with open(file_path, "r") as f:
                 data = json.load(f)
             
-            return OnboardingSession(**data)
+            return OnboardingSession.from_dict(data)
         except Exception as e:
-            logger.error(f"Failed to load session {session_id}: {e}")
+            logger.error("Failed to load session %s: %s", session_id, e)
             return None
 
 
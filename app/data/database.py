@@ -3,21 +3,22 @@ Encrypted SQLite database repository for the mnm CLI.
 
 Uses SQLCipher for AES-256 encryption at rest.
 """
+import asyncio
+import hashlib
 import json
 import os
 import sqlite3
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
-from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import date, datetime
 from uuid import UUID
 
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes
-
 from app.models import (
     Asset, Liability, FinancialTask, UpcomingExpense,
     UserProfile, IncomeSource, SpendingCategory, Transaction
 )
+from app.data.repository import FileRepository
 from app.core.logging import get_logger
 
 logger = get_logger("database")
@@ -38,15 +39,34 @@ def get_or_create_salt(data_dir: Path) -> bytes:
     return salt
 
 
+# Derived keys of open databases, by (salt, SHA-256 of password)
+_key_cache: Dict[Tuple[bytes, bytes], bytes] = {}
+
+
+def _key_cache_key(password: str, salt: bytes) -> Tuple[bytes, bytes]:
+    return (salt, hashlib.sha256(password.encode()).digest())
+
+
 def derive_key(password: str, salt: bytes) -> bytes:
-    """Derive encryption key from password using PBKDF2."""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=ITERATIONS,
-    )
-    return kdf.derive(password.encode())
+    """
+    Derive encryption key from password using PBKDF2.
+
+    The key is kept until forget_key() drops it, so connecting again with
+    the same salt and password in the meantime reuses it.
+    """
+    cache_key = _key_cache_key(password, salt)
+    key = _key_cache.get(cache_key)
+    if key is None:
+        # OpenSSL's PBKDF2, with the GIL released; same output as PBKDF2HMAC
+        key = _key_cache[cache_key] = hashlib.pbkdf2_hmac(
+            "sha256", password.encode(), salt, ITERATIONS, dklen=32
+        )
+    return key
+
+
+def forget_key(password: str, salt: bytes) -> None:
+    """Drop a derived key from the cache, if it is there."""
+    _key_cache.pop(_key_cache_key(password, salt), None)
 
 
 class SecureDatabase:
@@ -56,7 +76,27 @@ class SecureDatabase:
     Provides persistent storage for financial data with encryption at rest.
     """
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 4
+
+    # Exported lists of records: (key, query, model)
+    _EXPORT_TABLES = (
+        ("assets", "SELECT data FROM assets", Asset),
+        ("liabilities", "SELECT data FROM liabilities", Liability),
+        ("tasks", "SELECT data FROM tasks ORDER BY due_date", FinancialTask),
+        ("upcoming_expenses", "SELECT data FROM upcoming_expenses ORDER BY due_date", UpcomingExpense),
+        ("income", "SELECT data FROM income", IncomeSource),
+        ("spending_plan", "SELECT data FROM spending_plan", SpendingCategory),
+    )
+
+    # Applied to every connection after keying. WAL keeps readers and the
+    # writer from blocking each other, which makes NORMAL sync safe.
+    _PRAGMAS = (
+        "journal_mode = WAL",
+        "synchronous = NORMAL",
+        "temp_store = MEMORY",
+        "cache_size = -65536",  # 64 MiB
+        "mmap_size = 268435456",  # 256 MiB
+    )
 
     def __init__(self, data_dir: Path, encrypted: bool = True):
         self.data_dir = Path(data_dir)
@@ -64,6 +104,8 @@ class SecureDatabase:
         self.encrypted = encrypted
         self._connection: Optional[sqlite3.Connection] = None
         self._password: Optional[str] = None
+        self._salt: Optional[bytes] = None
+        self._key: Optional[bytes] = None
 
     @property
     def is_connected(self) -> bool:
@@ -82,30 +124,74 @@ class SecureDatabase:
                 raise ValueError("Password required for encrypted database")
 
             try:
-                import sqlcipher3
-                self._connection = sqlcipher3.connect(str(self.db_path))
+                import sqlcipher3  # noqa: F401
                 salt = get_or_create_salt(self.data_dir)
-                key = derive_key(password, salt)
-                self._connection.execute(f"PRAGMA key = \"x'{key.hex()}'\";")
+                self._key = derive_key(password, salt)
+                self._connection = self._open_connection()
                 self._password = password
+                self._salt = salt
                 logger.info("Connected to encrypted database")
             except ImportError:
                 logger.warning("sqlcipher3 not available, falling back to unencrypted SQLite")
-                self._connection = sqlite3.connect(str(self.db_path))
                 self.encrypted = False
+                self._connection = self._open_connection()
         else:
-            self._connection = sqlite3.connect(str(self.db_path))
+            self._connection = self._open_connection()
             logger.info("Connected to unencrypted database")
 
-        self._connection.row_factory = sqlite3.Row
-        self._run_migrations()
+        try:
+            self._run_migrations()
+        except Exception:
+            # A wrong password first fails here; don't keep its key cached
+            self.close()
+            raise
+
+    def _open_connection(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """Open a new connection to the database file, keyed if encrypted."""
+        if self.encrypted:
+            import sqlcipher3
+            connection = sqlcipher3.connect(str(self.db_path), check_same_thread=check_same_thread)
+            connection.execute(f"PRAGMA key = \"x'{self._key.hex()}'\";")
+        else:
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=check_same_thread)
+
+        for pragma in self._PRAGMAS:
+            connection.execute(f"PRAGMA {pragma}")
+
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def open_copy(self, check_same_thread: bool = True) -> "SecureDatabase":
+        """
+        Open another connection to the same database on the calling thread.
+
+        SQLite connections only work on the thread that opened them, so a
+        background worker needs its own. The copy reuses the derived key
+        instead of running the key derivation again.
+
+        With check_same_thread=False the copy may be used from any thread,
+        so successive workers can share it; the caller must make sure only
+        one thread uses it at a time.
+        """
+        if not self.is_connected:
+            raise RuntimeError("Database is not connected")
+
+        copy = SecureDatabase(self.data_dir, encrypted=self.encrypted)
+        copy._key = self._key
+        copy._connection = copy._open_connection(check_same_thread)
+        return copy
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, dropping the key it derived from the cache."""
         if self._connection:
             self._connection.close()
             self._connection = None
+            # Copies share the key but did not derive it, so leave it to the original
+            if self._password is not None:
+                forget_key(self._password, self._salt)
             self._password = None
+            self._salt = None
+            self._key = None
 
     def _run_migrations(self) -> None:
         """Run database migrations to ensure schema is up to date."""
@@ -127,6 +213,18 @@ class SecureDatabase:
             self._migrate_v1(cursor)
             cursor.execute("INSERT INTO schema_version (version) VALUES (1)")
 
+        if current_version < 2:
+            self._migrate_v2(cursor)
+            cursor.execute("INSERT INTO schema_version (version) VALUES (2)")
+
+        if current_version < 3:
+            self._migrate_v3(cursor)
+            cursor.execute("INSERT INTO schema_version (version) VALUES (3)")
+
+        if current_version < 4:
+            self._migrate_v4(cursor)
+            cursor.execute("INSERT INTO schema_version (version) VALUES (4)")
+
         self._connection.commit()
 
     def _migrate_v1(self, cursor: sqlite3.Cursor) -> None:
@@ -205,6 +303,58 @@ class SecureDatabase:
 
         logger.info("Database schema v1 created")
 
+    def _migrate_v2(self, cursor: sqlite3.Cursor) -> None:
+        """Expose amounts summed by the dashboard as indexed generated columns."""
+        # ALTER TABLE can only add VIRTUAL generated columns; the indexes
+        # store the extracted values for range filters and ordering
+        columns = (
+            ("assets", "value", "REAL", "$.value"),
+            ("liabilities", "balance", "REAL", "$.balance"),
+            ("upcoming_expenses", "amount", "REAL", "$.amount"),
+            ("transactions", "amount", "REAL", "$.amount"),
+            ("transactions", "category", "TEXT", "$.category"),
+        )
+        for table, column, sql_type, path in columns:
+            cursor.execute(f"""
+                ALTER TABLE {table} ADD COLUMN {column} {sql_type}
+                GENERATED ALWAYS AS (CAST(json_extract(data, '{path}') AS {sql_type})) VIRTUAL
+            """)
+
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_assets_value ON assets(value)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_liabilities_balance ON liabilities(balance)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_expenses_due_amount ON upcoming_expenses(due_date, amount)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category, date, amount)"
+        )
+
+        logger.info("Database schema v2 created")
+
+    def _migrate_v3(self, cursor: sqlite3.Cursor) -> None:
+        """Store UUID keys as 16-byte blobs instead of 36-character text."""
+        # Blob values are stored as-is whatever the declared column type,
+        # so the tables keep their schema and only the key values change
+        for table in ("assets", "liabilities", "spending_plan", "tasks", "upcoming_expenses"):
+            ids = [row[0] for row in cursor.execute(f"SELECT id FROM {table} WHERE typeof(id) = 'text'")]
+            cursor.executemany(
+                f"UPDATE {table} SET id = ? WHERE id = ?",
+                ((UUID(text_id).bytes, text_id) for text_id in ids)
+            )
+
+        logger.info("Database schema v3 created")
+
+    def _migrate_v4(self, cursor: sqlite3.Cursor) -> None:
+        """Index open tasks by due date for the task list queries."""
+        # WHERE completed = ? ORDER BY due_date becomes one index range read;
+        # the composite index also covers every lookup the old one served
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tasks_completed_due ON tasks(completed, due_date)"
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_tasks_completed")
+
+        logger.info("Database schema v4 created")
+
     def _serialize(self, model) -> str:
         """Serialize a Pydantic model to JSON."""
         try:
@@ -214,36 +364,37 @@ class SecureDatabase:
 
     def _deserialize(self, data: str, model_class):
         """Deserialize JSON to a Pydantic model."""
-        return model_class(**json.loads(data))
+        # Pydantic parses and validates in one pass, with no dict in between
+        return model_class.model_validate_json(data)
 
     # === Asset Operations ===
 
     def get_assets(self) -> List[Asset]:
         """Get all assets."""
         cursor = self._connection.execute("SELECT data FROM assets")
-        return [self._deserialize(row[0], Asset) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], Asset) for row in cursor]
 
     def save_asset(self, asset: Asset) -> None:
         """Save or update an asset."""
         self._connection.execute(
-            "INSERT OR REPLACE INTO assets (id, data) VALUES (?, ?)",
-            (str(asset.id), self._serialize(asset))
+            "INSERT INTO assets (id, data) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+            (asset.id.bytes, self._serialize(asset))
         )
         self._connection.commit()
 
     def save_assets(self, assets: List[Asset]) -> None:
-        """Save multiple assets."""
-        cursor = self._connection.cursor()
-        for asset in assets:
-            cursor.execute(
-                "INSERT OR REPLACE INTO assets (id, data) VALUES (?, ?)",
-                (str(asset.id), self._serialize(asset))
+        """Save multiple assets in one transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO assets (id, data) VALUES (?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                ((asset.id.bytes, self._serialize(asset)) for asset in assets)
             )
-        self._connection.commit()
 
     def delete_asset(self, asset_id: UUID) -> None:
         """Delete an asset."""
-        self._connection.execute("DELETE FROM assets WHERE id = ?", (str(asset_id),))
+        self._connection.execute("DELETE FROM assets WHERE id = ?", (asset_id.bytes,))
         self._connection.commit()
 
     # === Liability Operations ===
@@ -251,25 +402,34 @@ class SecureDatabase:
     def get_liabilities(self) -> List[Liability]:
         """Get all liabilities."""
         cursor = self._connection.execute("SELECT data FROM liabilities")
-        return [self._deserialize(row[0], Liability) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], Liability) for row in cursor]
 
     def save_liability(self, liability: Liability) -> None:
         """Save or update a liability."""
         self._connection.execute(
-            "INSERT OR REPLACE INTO liabilities (id, data) VALUES (?, ?)",
-            (str(liability.id), self._serialize(liability))
+            "INSERT INTO liabilities (id, data) VALUES (?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+            (liability.id.bytes, self._serialize(liability))
         )
         self._connection.commit()
 
     def save_liabilities(self, liabilities: List[Liability]) -> None:
-        """Save multiple liabilities."""
-        cursor = self._connection.cursor()
-        for liability in liabilities:
-            cursor.execute(
-                "INSERT OR REPLACE INTO liabilities (id, data) VALUES (?, ?)",
-                (str(liability.id), self._serialize(liability))
+        """Save multiple liabilities in one transaction."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO liabilities (id, data) VALUES (?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
+                ((liability.id.bytes, self._serialize(liability)) for liability in liabilities)
             )
-        self._connection.commit()
+
+    def get_balances_snapshot(self) -> Tuple[List[Asset], List[Liability]]:
+        """Get all assets and liabilities using a single cursor."""
+        cursor = self._connection.cursor()
+        cursor.execute("SELECT data FROM assets")
+        assets = [self._deserialize(row[0], Asset) for row in cursor]
+        cursor.execute("SELECT data FROM liabilities")
+        liabilities = [self._deserialize(row[0], Liability) for row in cursor]
+        return assets, liabilities
 
     # === Task Operations ===
 
@@ -283,32 +443,34 @@ class SecureDatabase:
             cursor = self._connection.execute(
                 "SELECT data FROM tasks WHERE completed = 0 ORDER BY due_date"
             )
-        return [self._deserialize(row[0], FinancialTask) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], FinancialTask) for row in cursor]
 
-    def get_upcoming_tasks(self, days: int = 7) -> List[FinancialTask]:
-        """Get tasks due within the specified number of days."""
+    def get_upcoming_tasks(self, days: int = 7, limit: Optional[int] = None) -> List[FinancialTask]:
+        """Get tasks due within the specified number of days, at most limit of them."""
         cursor = self._connection.execute("""
             SELECT data FROM tasks
             WHERE completed = 0
-            AND (due_date IS NULL OR date(due_date) <= date('now', '+' || ? || ' days'))
+            AND (due_date IS NULL OR due_date <= date('now', '+' || ? || ' days'))
             ORDER BY due_date
-        """, (days,))
-        return [self._deserialize(row[0], FinancialTask) for row in cursor.fetchall()]
+            LIMIT ?
+        """, (days, -1 if limit is None else limit))
+        return [self._deserialize(row[0], FinancialTask) for row in cursor]
 
     def save_task(self, task: FinancialTask) -> None:
         """Save or update a financial task."""
         due_date_str = task.due_date.isoformat() if task.due_date else None
         self._connection.execute(
-            "INSERT OR REPLACE INTO tasks (id, data, due_date, completed) VALUES (?, ?, ?, ?)",
-            (str(task.id), self._serialize(task), due_date_str, 1 if task.completed else 0)
+            "INSERT INTO tasks (id, data, due_date, completed) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET "
+            "data = excluded.data, due_date = excluded.due_date, completed = excluded.completed",
+            (task.id.bytes, self._serialize(task), due_date_str, 1 if task.completed else 0)
         )
         self._connection.commit()
 
     def complete_task(self, task_id: UUID) -> None:
         """Mark a task as completed."""
-        from datetime import datetime
         cursor = self._connection.execute(
-            "SELECT data FROM tasks WHERE id = ?", (str(task_id),)
+            "SELECT data FROM tasks WHERE id = ?", (task_id.bytes,)
         )
         row = cursor.fetchone()
         if row:
@@ -317,39 +479,82 @@ class SecureDatabase:
             task.completed_at = datetime.now()
             self.save_task(task)
 
+    def delete_task(self, task_id: UUID) -> None:
+        """Delete a financial task."""
+        self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id.bytes,))
+        self._connection.commit()
+
     # === Upcoming Expense Operations ===
 
-    def get_upcoming_expenses(self, days: int = 30) -> List[UpcomingExpense]:
-        """Get expenses due within the specified number of days."""
+    def get_upcoming_expenses(self, days: int = 30, limit: Optional[int] = None) -> List[UpcomingExpense]:
+        """Get expenses due within the specified number of days, at most limit of them."""
         cursor = self._connection.execute("""
             SELECT data FROM upcoming_expenses
-            WHERE date(due_date) <= date('now', '+' || ? || ' days')
+            WHERE due_date <= date('now', '+' || ? || ' days')
             ORDER BY due_date
-        """, (days,))
-        return [self._deserialize(row[0], UpcomingExpense) for row in cursor.fetchall()]
+            LIMIT ?
+        """, (days, -1 if limit is None else limit))
+        return [self._deserialize(row[0], UpcomingExpense) for row in cursor]
 
     def get_all_expenses(self) -> List[UpcomingExpense]:
         """Get all upcoming expenses."""
         cursor = self._connection.execute(
             "SELECT data FROM upcoming_expenses ORDER BY due_date"
         )
-        return [self._deserialize(row[0], UpcomingExpense) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], UpcomingExpense) for row in cursor]
 
     def save_expense(self, expense: UpcomingExpense) -> None:
         """Save or update an upcoming expense."""
         self._connection.execute(
-            "INSERT OR REPLACE INTO upcoming_expenses (id, data, due_date) VALUES (?, ?, ?)",
-            (str(expense.id), self._serialize(expense), expense.due_date.isoformat())
+            "INSERT INTO upcoming_expenses (id, data, due_date) VALUES (?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data, due_date = excluded.due_date",
+            (expense.id.bytes, self._serialize(expense), expense.due_date.isoformat())
         )
         self._connection.commit()
 
     def delete_expense(self, expense_id: UUID) -> None:
         """Delete an upcoming expense."""
         self._connection.execute(
-            "DELETE FROM upcoming_expenses WHERE id = ?", (str(expense_id),)
+            "DELETE FROM upcoming_expenses WHERE id = ?", (expense_id.bytes,)
         )
         self._connection.commit()
 
+    # === Dashboard Operations ===
+
+    def get_totals(self, task_days: int = 7, expense_days: int = 30) -> dict:
+        """
+        Get the dashboard totals in one query, summed by SQLite rather than
+        by loading and validating every model in Python.
+
+        The amount columns are virtual, so SQLite still extracts each value
+        from the row's JSON as it reads it. Due dates are stored as
+        YYYY-MM-DD text and compared directly, so the task and expense
+        windows are range searches on their due-date indexes. The windows
+        match get_upcoming_tasks() and get_upcoming_expenses() for the same
+        number of days.
+        """
+        row = self._connection.execute("""
+            SELECT
+                (SELECT COALESCE(SUM(value), 0) FROM assets),
+                (SELECT COUNT(*) FROM assets),
+                (SELECT COALESCE(SUM(balance), 0) FROM liabilities),
+                (SELECT COUNT(*) FROM liabilities),
+                (SELECT COUNT(*) FROM tasks
+                    WHERE completed = 0
+                    AND (due_date IS NULL OR due_date <= date('now', '+' || ? || ' days'))),
+                (SELECT COALESCE(SUM(amount), 0) FROM upcoming_expenses
+                    WHERE due_date <= date('now', '+' || ? || ' days'))
+        """, (task_days, expense_days)).fetchone()
+
+        return {
+            "total_assets": float(row[0]),
+            "asset_count": row[1],
+            "total_debt": float(row[2]),
+            "debt_count": row[3],
+            "task_count": row[4],
+            "total_expenses": float(row[5]),
+        }
+
     # === User Profile Operations ===
 
     def get_user_profile(self) -> Optional[UserProfile]:
@@ -363,7 +568,8 @@ class SecureDatabase:
     def save_user_profile(self, profile: UserProfile) -> None:
         """Save the user profile."""
         self._connection.execute(
-            "INSERT OR REPLACE INTO user_profile (id, data) VALUES (1, ?)",
+            "INSERT INTO user_profile (id, data) VALUES (1, ?) "
+            "ON CONFLICT(id) DO UPDATE SET data = excluded.data",
             (self._serialize(profile),)
         )
         self._connection.commit()
@@ -373,36 +579,32 @@ class SecureDatabase:
     def get_income(self) -> List[IncomeSource]:
         """Get all income sources."""
         cursor = self._connection.execute("SELECT data FROM income")
-        return [self._deserialize(row[0], IncomeSource) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], IncomeSource) for row in cursor]
 
     def save_income(self, sources: List[IncomeSource]) -> None:
-        """Save income sources (replaces all)."""
-        cursor = self._connection.cursor()
-        cursor.execute("DELETE FROM income")
-        for source in sources:
-            cursor.execute(
+        """Save income sources (replaces all) in one transaction."""
+        with self._connection:
+            self._connection.execute("DELETE FROM income")
+            self._connection.executemany(
                 "INSERT INTO income (data) VALUES (?)",
-                (self._serialize(source),)
+                ((self._serialize(source),) for source in sources)
             )
-        self._connection.commit()
 
     # === Spending Plan Operations ===
 
     def get_spending_plan(self) -> List[SpendingCategory]:
         """Get the spending plan."""
         cursor = self._connection.execute("SELECT data FROM spending_plan")
-        return [self._deserialize(row[0], SpendingCategory) for row in cursor.fetchall()]
+        return [self._deserialize(row[0], SpendingCategory) for row in cursor]
 
     def save_spending_plan(self, categories: List[SpendingCategory]) -> None:
-        """Save spending categories."""
-        cursor = self._connection.cursor()
-        cursor.execute("DELETE FROM spending_plan")
-        for category in categories:
-            cursor.execute(
+        """Save spending categories (replaces all) in one transaction."""
+        with self._connection:
+            self._connection.execute("DELETE FROM spending_plan")
+            self._connection.executemany(
                 "INSERT INTO spending_plan (id, data) VALUES (?, ?)",
-                (str(category.id), self._serialize(category))
+                ((category.id.bytes, self._serialize(category)) for category in categories)
             )
-        self._connection.commit()
 
     # === Migration from FileRepository ===
 
@@ -412,9 +614,6 @@ class SecureDatabase:
 
         Returns a dict with counts of migrated items.
         """
-        from app.data.repository import FileRepository
-        import asyncio
-
         counts = {
             "assets": 0,
             "liabilities": 0,
@@ -425,66 +624,109 @@ class SecureDatabase:
 
         file_repo = FileRepository(json_data_dir)
 
-        # Run async methods synchronously
-        loop = asyncio.new_event_loop()
-
-        try:
-            # Migrate assets
-            assets = loop.run_until_complete(file_repo.get_assets())
-            if assets:
-                self.save_assets(assets)
-                counts["assets"] = len(assets)
-
-            # Migrate liabilities
-            liabilities = loop.run_until_complete(file_repo.get_liabilities())
-            if liabilities:
-                self.save_liabilities(liabilities)
-                counts["liabilities"] = len(liabilities)
-
-            # Migrate income
-            income = loop.run_until_complete(file_repo.get_income())
-            if income:
-                self.save_income(income)
-                counts["income"] = len(income)
-
-            # Migrate spending plan
-            spending = loop.run_until_complete(file_repo.get_spending_plan())
-            if spending:
-                self.save_spending_plan(spending)
-                counts["spending"] = len(spending)
-
-            # Migrate user profile
+        async def read_profile() -> Optional[UserProfile]:
             try:
-                profile = loop.run_until_complete(file_repo.get_user_profile())
-                if profile:
-                    self.save_user_profile(profile)
-                    counts["user"] = True
+                return await file_repo.get_user_profile()
             except Exception as e:
-                logger.warning(f"Could not migrate user profile: {e}")
-        finally:
-            loop.close()
+                logger.warning("Could not migrate user profile: %s", e)
+                return None
+
+        async def read_all():
+            return await asyncio.gather(
+                file_repo.get_assets(),
+                file_repo.get_liabilities(),
+                file_repo.get_income(),
+                file_repo.get_spending_plan(),
+                read_profile(),
+            )
+
+        # Read every file concurrently on one event loop, then write
+        assets, liabilities, income, spending, profile = asyncio.run(read_all())
+
+        if assets:
+            self.save_assets(assets)
+            counts["assets"] = len(assets)
+
+        if liabilities:
+            self.save_liabilities(liabilities)
+            counts["liabilities"] = len(liabilities)
+
+        if income:
+            self.save_income(income)
+            counts["income"] = len(income)
 
-        logger.info(f"Migration complete: {counts}")
+        if spending:
+            self.save_spending_plan(spending)
+            counts["spending"] = len(spending)
+
+        if profile:
+            self.save_user_profile(profile)
+            counts["user"] = True
+
+        logger.info("Migration complete: %s", counts)
         return counts
 
     # === Export Operations ===
 
+    def _to_dict(self, model) -> dict:
+        """Convert a Pydantic model to a plain dict."""
+        try:
+            return model.model_dump()
+        except AttributeError:
+            return model.dict()
+
+    def _iter_rows(self, sql: str, model_class) -> Iterator[dict]:
+        """Yield each row of a query as an exported dict."""
+        for row in self._connection.execute(sql):
+            yield self._to_dict(self._deserialize(row[0], model_class))
+
+    def iter_export(self) -> Iterator[Tuple[str, Iterator[dict]]]:
+        """
+        Yield (key, rows) pairs for every exported list of records.
+
+        Rows are read from the cursor as the caller iterates them, so an
+        export can be written out without holding every table in memory.
+        For a JSON document use iter_export_json(), which copies the stored
+        JSON text instead of building models.
+        The user profile is a single record; use get_user_profile() for it.
+        """
+        for key, sql, model_class in self._EXPORT_TABLES:
+            yield key, self._iter_rows(sql, model_class)
+
+    def iter_export_json(self) -> Iterator[Tuple[str, Iterator[str]]]:
+        """
+        Yield (key, rows) pairs like iter_export(), each row as its stored JSON text.
+
+        Stored rows are model_dump_json() output, so they can be copied
+        into a JSON document as-is, with no parsing or model building.
+        """
+        for key, sql, _model_class in self._EXPORT_TABLES:
+            yield key, (row[0] for row in self._connection.execute(sql))
+
+    def get_user_profile_json(self) -> Optional[str]:
+        """Get the user profile as its stored JSON text, if there is one."""
+        row = self._connection.execute("SELECT data FROM user_profile WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def iter_export_rows(self) -> Iterator[Tuple[str, List[str], Iterator[tuple]]]:
+        """
+        Yield (key, fieldnames, rows) for every exported list of records.
+
+        Like iter_export(), but each row is a tuple of values in fieldnames
+        order, ready for tabular writers such as csv.writer.
+        """
+        for key, sql, model_class in self._EXPORT_TABLES:
+            fieldnames = list(model_class.model_fields)
+            getter = attrgetter(*fieldnames)
+            rows = (
+                getter(self._deserialize(row[0], model_class))
+                for row in self._connection.execute(sql)
+            )
+            yield key, fieldnames, rows
+
     def export_all(self) -> dict:
         """Export all data as a dictionary."""
-        return {
-            "assets": [a.model_dump() if hasattr(a, 'model_dump') else a.dict()
-                      for a in self.get_assets()],
-            "liabilities": [l.model_dump() if hasattr(l, 'model_dump') else l.dict()
-                           for l in self.get_liabilities()],
-            "tasks": [t.model_dump() if hasattr(t, 'model_dump') else t.dict()
-                     for t in self.get_tasks(include_completed=True)],
-            "upcoming_expenses": [e.model_dump() if hasattr(e, 'model_dump') else e.dict()
-                                  for e in self.get_all_expenses()],
-            "income": [i.model_dump() if hasattr(i, 'model_dump') else i.dict()
-                      for i in self.get_income()],
-            "spending_plan": [s.model_dump() if hasattr(s, 'model_dump') else s.dict()
-                             for s in self.get_spending_plan()],
-            "user_profile": (self.get_user_profile().model_dump()
-                            if self.get_user_profile() and hasattr(self.get_user_profile(), 'model_dump')
-                            else self.get_user_profile().dict() if self.get_user_profile() else None)
-        }
+        data = {key: list(rows) for key, rows in self.iter_export()}
+        profile = self.get_user_profile()
+        data["user_profile"] = self._to_dict(profile) if profile else None
+        return data
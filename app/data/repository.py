@@ -2,10 +2,12 @@ import asyncio
 import csv
 import json
 import os
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Type, TypeVar, Union, Any
 from datetime import datetime
-from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
 
 from app.models import Asset, Liability, IncomeSource, SpendingCategory, Transaction, UserProfile, AssetType
 from app.core.logging import get_logger
@@ -15,11 +17,54 @@ logger = get_logger("repository")
 
 T = TypeVar("T", bound=Union[Asset, Liability, IncomeSource])
 
+# List validators and serializers, built once per model; pydantic-core
+# handles UUIDs, enums and dates itself
+_LIST_ADAPTERS: Dict[type, TypeAdapter] = {
+    model: TypeAdapter(List[model])
+    for model in (Asset, Liability, IncomeSource, SpendingCategory)
+}
+
+# Seconds a cached file is trusted before it is stat-checked again
+STAT_TTL = 0.1
+
+
+def _safe_stat(path: Path) -> Optional[os.stat_result]:
+    """Stat a file, or return None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
 class FileRepository:
     def __init__(self, root_dir: Path = Path("data")):
         self.root_dir = root_dir
         self._cache: Dict[str, Any] = {}
         self._mtimes: Dict[str, float] = {}
+        # When each cached file was last stat-checked (time.monotonic())
+        self._checked: Dict[str, float] = {}
+
+    def _recently_checked(self, file_str: str) -> bool:
+        """Whether a cached file was confirmed current less than STAT_TTL ago."""
+        checked = self._checked.get(file_str)
+        return (
+            checked is not None
+            and file_str in self._mtimes
+            and time.monotonic() - checked < STAT_TTL
+        )
+
+    def _cached_if_current(self, file_str: str, mtime: float) -> Optional[Any]:
+        """Return the cached value if it was loaded at mtime, marking it just checked."""
+        if file_str in self._cache and self._mtimes.get(file_str) == mtime:
+            self._checked[file_str] = time.monotonic()
+            return self._cache[file_str]
+        return None
+
+    def _store_cache(self, file_str: str, value: Any, mtime: float) -> None:
+        """Cache a value freshly loaded from a file with the given mtime."""
+        self._cache[file_str] = value
+        self._mtimes[file_str] = mtime
+        self._checked[file_str] = time.monotonic()
 
     @property
     def assets_file(self) -> Path:
@@ -53,42 +98,58 @@ class FileRepository:
         """
         Loads JSON data asynchronously with caching based on file modification time.
         """
+        items = await self._load_json_cached(file_path, model)
+        return [] if items is None else items
+
+    async def _load_json_cached(self, file_path: Path, model: Type[T]) -> Optional[List[T]]:
+        """
+        Load a JSON list through the cache, or return None if the file does not exist.
+
+        An entry is only marked as checked once it is known to match the
+        file, so a just-checked entry is always safe to serve.
+        """
         file_str = str(file_path)
         
-        # Check if file exists
-        if not await asyncio.to_thread(file_path.exists):
-            return []
-
-        # Check modification time
-        stats = await asyncio.to_thread(file_path.stat)
+        # Serve a just-checked cache entry without leaving the event loop
+        if self._recently_checked(file_str):
+            return self._cache[file_str]
+        
+        # Check existence and modification time in one syscall
+        stats = await asyncio.to_thread(_safe_stat, file_path)
+        if stats is None:
+            return None
         mtime = stats.st_mtime
 
         # Return cached data if file hasn't changed
-        if file_str in self._cache and self._mtimes.get(file_str) == mtime:
-            return self._cache[file_str]
+        cached = self._cached_if_current(file_str, mtime)
+        if cached is not None:
+            return cached
 
         # Load data
         try:
-            def read_json():
-                with open(file_path, "r") as f:
-                    return json.load(f)
+            raw = await asyncio.to_thread(file_path.read_bytes)
 
-            data = await asyncio.to_thread(read_json)
-            if not isinstance(data, list):
-                logger.warning(f"File {file_path} does not contain a list, got {type(data)}")
-                return []
-            
-            items = []
-            for item in data:
-                try:
-                    items.append(model(**item))
-                except Exception as e:
-                    logger.warning(f"Skipping invalid item in {file_path}: {e}")
-                    continue
+            try:
+                # Parse and validate the whole list in one pass in pydantic-core
+                items = _LIST_ADAPTERS[model].validate_json(raw)
+            except ValidationError:
+                # Parse it again to report what was wrong, skipping only the
+                # invalid items
+                data = json.loads(raw)
+                if not isinstance(data, list):
+                    logger.warning(f"File {file_path} does not contain a list, got {type(data)}")
+                    return []
+
+                items = []
+                for item in data:
+                    try:
+                        items.append(model(**item))
+                    except Exception as e:
+                        logger.warning(f"Skipping invalid item in {file_path}: {e}")
+                        continue
             
             # Update cache
-            self._cache[file_str] = items
-            self._mtimes[file_str] = mtime
+            self._store_cache(file_str, items, mtime)
             return items
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Error loading {file_path}: {e}")
@@ -107,19 +168,9 @@ class FileRepository:
         return await self._load_json_async(self.income_file, IncomeSource)
 
     async def get_spending_plan(self) -> List[SpendingCategory]:
-        file_str = str(self.spending_file)
-        
         # 1. Try loading JSON first
-        if await asyncio.to_thread(self.spending_file.exists):
-            stats = await asyncio.to_thread(self.spending_file.stat)
-            mtime = stats.st_mtime
-
-            if file_str in self._cache and self._mtimes.get(file_str) == mtime:
-                return self._cache[file_str]
-            
-            items = await self._load_json_async(self.spending_file, SpendingCategory)
-            self._cache[file_str] = items
-            self._mtimes[file_str] = mtime
+        items = await self._load_json_cached(self.spending_file, SpendingCategory)
+        if items is not None:
             return items
 
         # 2. Fallback to CSV migration
@@ -154,14 +205,7 @@ class FileRepository:
     async def save_spending_plan(self, items: List[SpendingCategory]):
         def write_json():
             self.spending_file.parent.mkdir(exist_ok=True)
-            with open(self.spending_file, "w") as f:
-                 # Handle serialization safely
-                data = [item.dict() for item in items]
-                # Convert UUIDs to strings for JSON
-                for d in data:
-                    if 'id' in d and isinstance(d['id'], UUID):
-                        d['id'] = str(d['id'])
-                json.dump(data, f, indent=2, default=str)
+            self.spending_file.write_bytes(_LIST_ADAPTERS[SpendingCategory].dump_json(items, indent=2))
         
         await asyncio.to_thread(write_json)
         # Invalidate cache
@@ -194,20 +238,22 @@ class FileRepository:
     async def get_user_profile(self) -> UserProfile:
         file_str = str(self.user_file)
         
-        # Check if file exists
-        if not await asyncio.to_thread(self.user_file.exists):
+        if self._recently_checked(file_str):
+            return self._cache[file_str]
+        
+        # Check existence and modification time in one syscall
+        stats = await asyncio.to_thread(_safe_stat, self.user_file)
+        if stats is None:
             # Create default profile if missing
             default_profile = UserProfile(name="Euclid")
             await self.save_user_profile(default_profile)
             return default_profile
-
-        # Check modification time
-        stats = await asyncio.to_thread(self.user_file.stat)
         mtime = stats.st_mtime
 
         # Return cached data if file hasn't changed
-        if file_str in self._cache and self._mtimes.get(file_str) == mtime:
-            return self._cache[file_str]
+        cached = self._cached_if_current(file_str, mtime)
+        if cached is not None:
+            return cached
 
         # Load data
         try:
@@ -219,8 +265,7 @@ class FileRepository:
             profile = UserProfile(**data)
             
             # Update cache
-            self._cache[file_str] = profile
-            self._mtimes[file_str] = mtime
+            self._store_cache(file_str, profile, mtime)
             return profile
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Error loading {self.user_file}: {e}")
@@ -230,39 +275,20 @@ class FileRepository:
     async def save_user_profile(self, profile: UserProfile):
         def write_json():
             self.user_file.parent.mkdir(exist_ok=True)
-            with open(self.user_file, "w") as f:
-                # Use mode='json' (or model_dump for Pydantic v2) to serialize
-                # Since we might be on Pydantic v1 or v2, let's be safe. 
-                # Assuming Pydantic v1 based on existing code using .dict()
-                # If v2, use model_dump()
-                try:
-                    data = profile.model_dump()
-                except AttributeError:
-                    data = profile.dict()
-                # Handle UUID serialization
-                json.dump(data, f, indent=2, default=str)
+            self.user_file.write_text(profile.model_dump_json(indent=2), encoding="utf-8")
         
         await asyncio.to_thread(write_json)
         # Update cache immediately
         file_str = str(self.user_file)
-        if await asyncio.to_thread(self.user_file.exists):
-            stats = await asyncio.to_thread(self.user_file.stat)
-            self._mtimes[file_str] = stats.st_mtime
-            self._cache[file_str] = profile
+        stats = await asyncio.to_thread(_safe_stat, self.user_file)
+        if stats is not None:
+            self._store_cache(file_str, profile, stats.st_mtime)
 
     async def save_income(self, items: List[IncomeSource]):
         """Save income sources to JSON file."""
         def write_json():
             self.income_file.parent.mkdir(exist_ok=True)
-            with open(self.income_file, "w") as f:
-                data = []
-                for item in items:
-                    try:
-                        d = item.model_dump()
-                    except AttributeError:
-                        d = item.dict()
-                    data.append(d)
-                json.dump(data, f, indent=2, default=str)
+            self.income_file.write_bytes(_LIST_ADAPTERS[IncomeSource].dump_json(items, indent=2))
         
         await asyncio.to_thread(write_json)
         # Invalidate cache
@@ -276,21 +302,7 @@ class FileRepository:
         """Save liabilities to JSON file."""
         def write_json():
             self.liabilities_file.parent.mkdir(exist_ok=True)
-            with open(self.liabilities_file, "w") as f:
-                data = []
-                for item in items:
-                    try:
-                        d = item.model_dump()
-                    except AttributeError:
-                        d = item.dict()
-                    # Convert UUIDs to strings
-                    if 'id' in d and isinstance(d['id'], UUID):
-                        d['id'] = str(d['id'])
-                    # Convert enum values to strings
-                    if 'tags' in d:
-                        d['tags'] = [t.value if hasattr(t, 'value') else t for t in d['tags']]
-                    data.append(d)
-                json.dump(data, f, indent=2, default=str)
+            self.liabilities_file.write_bytes(_LIST_ADAPTERS[Liability].dump_json(items, indent=2))
         
         await asyncio.to_thread(write_json)
         # Invalidate cache
@@ -304,23 +316,7 @@ class FileRepository:
         """Save assets to JSON file."""
         def write_json():
             self.assets_file.parent.mkdir(exist_ok=True)
-            with open(self.assets_file, "w") as f:
-                data = []
-                for item in items:
-                    try:
-                        d = item.model_dump()
-                    except AttributeError:
-                        d = item.dict()
-                    # Convert UUIDs to strings
-                    if 'id' in d and isinstance(d['id'], UUID):
-                        d['id'] = str(d['id'])
-                    # Convert enum values to strings
-                    if 'type' in d and hasattr(d['type'], 'value'):
-                        d['type'] = d['type'].value
-                    if 'liquidity' in d and hasattr(d['liquidity'], 'value'):
-                        d['liquidity'] = d['liquidity'].value
-                    data.append(d)
-                json.dump(data, f, indent=2, default=str)
+            self.assets_file.write_bytes(_LIST_ADAPTERS[Asset].dump_json(items, indent=2))
         
         await asyncio.to_thread(write_json)
         # Invalidate cache
@@ -1,7 +1,11 @@
+from operator import attrgetter
 from typing import List, Dict
 from app.models import Asset, Liability, IncomeSource, SpendingCategory, AssetType
+from app.domain.financial_formulas import FREQUENCY_TO_MONTHLY
 
 class FinancialInsight:
+    __slots__ = ("title", "description", "severity", "action_item")
+
     def __init__(self, title: str, description: str, severity: str = "info", action_item: str = None):
         self.title = title
         self.description = description
@@ -25,19 +29,24 @@ def generate_insights(
     insights = []
     
     # 1. Cash Flow Analysis
-    total_monthly_income = 0
-    for i in income:
-        if i.frequency == "monthly":
-            total_monthly_income += i.amount
-        elif i.frequency == "bi-weekly":
-            total_monthly_income += i.amount * 26 / 12
-        elif i.frequency == "weekly":
-            total_monthly_income += i.amount * 52 / 12
-        elif i.frequency == "annually":
-            total_monthly_income += i.amount / 12
+    # Sources with an unknown frequency count for nothing
+    total_monthly_income = sum(
+        i.amount * FREQUENCY_TO_MONTHLY.get(i.frequency, 0.0) for i in income
+    )
+
+    total_monthly_spending = sum(map(attrgetter("amount"), spending))
+
+    # One pass over liabilities for both the payment total and the
+    # high-interest stats used in section 3
+    min_debt_payments = 0.0
+    high_interest_count = 0
+    high_interest_rate_sum = 0.0
+    for l in liabilities:
+        min_debt_payments += l.min_payment
+        if l.interest_rate > 0.07:
+            high_interest_count += 1
+            high_interest_rate_sum += l.interest_rate
 
-    total_monthly_spending = sum(s.amount for s in spending)
-    min_debt_payments = sum(l.min_payment for l in liabilities)
     total_outflow = total_monthly_spending + min_debt_payments
     
     free_cash_flow = total_monthly_income - total_outflow
@@ -85,12 +94,11 @@ def generate_insights(
         ))
 
     # 3. High Interest Debt Alert
-    high_interest_debts = [l for l in liabilities if l.interest_rate > 0.07]
-    if high_interest_debts:
-        avg_rate = sum(d.interest_rate for d in high_interest_debts) / len(high_interest_debts)
+    if high_interest_count:
+        avg_rate = high_interest_rate_sum / high_interest_count
         insights.append(FinancialInsight(
             title="Debt Alert",
-            description=f"You have {len(high_interest_debts)} high-interest loans slowing you down (Avg: {avg_rate*100:.1f}%).",
+            description=f"You have {high_interest_count} high-interest loans slowing you down (Avg: {avg_rate*100:.1f}%).",
             severity="warning",
             action_item="Use the Avalanche method to attack these aggressively."
         ))
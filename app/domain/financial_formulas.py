@@ -1,3 +1,4 @@
+import math
 from typing import List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -95,6 +96,33 @@ def calculate_compound_step(current_value: float, annual_rate: float, contributi
     interest = calculate_monthly_interest(current_value, annual_rate, periods_per_year)
     return current_value + interest + contribution
 
+def calculate_compound_series(current_value: float, annual_rate: float, contribution: float, num_periods: int, periods_per_year: int = 12) -> List[float]:
+    """
+    Calculates the value at the end of each of num_periods compound steps.
+    
+    Equivalent to calling calculate_compound_step num_periods times, but
+    runs as a single tight loop for projections over many periods.
+    
+    Args:
+        current_value: The starting value.
+        annual_rate: The annual interest rate (decimal).
+        contribution: The amount added each period.
+        num_periods: Number of periods to project.
+        periods_per_year: Number of compounding periods per year. Default is 12 (monthly).
+        
+    Returns:
+        The value after each period, in order.
+    """
+    periodic_rate = annual_rate / periods_per_year
+    values = []
+    append = values.append
+    value = current_value
+    for _ in range(num_periods):
+        # Same operation order as calculate_compound_step, so results match exactly
+        value = value + value * periodic_rate + contribution
+        append(value)
+    return values
+
 def calculate_runway(liquidity: float, monthly_burn: float, days_in_period: int = 30) -> int:
     """
     Calculates how many days the liquidity will last given the monthly burn rate.
@@ -131,7 +159,10 @@ def calculate_amortization_payment(principal: float, annual_rate: float, years:
     num_payments = years * periods_per_year
     
     # Formula: P = (r * PV) / (1 - (1 + r)^-n)
-    payment = (periodic_rate * principal) / (1 - (1 + periodic_rate) ** -num_payments)
+    # 1 - (1 + r)^-n is computed as -expm1(-n * log1p(r)), which keeps its
+    # precision when r is tiny
+    denominator = -math.expm1(-num_payments * math.log1p(periodic_rate))
+    payment = (periodic_rate * principal) / denominator
     return payment
 
 def calculate_future_value(principal: float, annual_rate: float, years: int, periods_per_year: int = 12) -> float:
@@ -146,7 +177,7 @@ def calculate_future_value(principal: float, annual_rate: float, years: int, per
     """
     rate_per_period = annual_rate / periods_per_year
     total_periods = years * periods_per_year
-    return principal * ((1 + rate_per_period) ** total_periods)
+    return principal * math.pow(1 + rate_per_period, total_periods)
 
 def calculate_present_value(future_value: float, annual_rate: float, years: int, periods_per_year: int = 12) -> float:
     """
@@ -160,7 +191,7 @@ def calculate_present_value(future_value: float, annual_rate: float, years: int,
     """
     rate_per_period = annual_rate / periods_per_year
     total_periods = years * periods_per_year
-    return future_value / ((1 + rate_per_period) ** total_periods)
+    return future_value / math.pow(1 + rate_per_period, total_periods)
 
 def calculate_real_return_rate(nominal_rate: float, inflation_rate: float) -> float:
     """
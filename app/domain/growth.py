@@ -4,7 +4,7 @@ import math
 from datetime import date, timedelta
 from pydantic import BaseModel
 from .types import TimeSeriesPoint
-from .financial_formulas import calculate_compound_step, calculate_real_return_rate
+from .financial_formulas import calculate_compound_series, calculate_real_return_rate
 
 class ProjectionContext(BaseModel):
     series: List[TimeSeriesPoint]
@@ -126,6 +126,11 @@ def project_compound_growth(
             monthly_contribution
         )
 
+    # Every period's nominal value, computed in one pass
+    nominal_values = calculate_compound_series(
+        principal, rate, monthly_contribution, total_periods, periods_per_year
+    )
+
     for period in range(1, total_periods + 1):
         # Step date
         # Assuming monthly periods for date calculation if periods_per_year is 12
@@ -136,7 +141,7 @@ def project_compound_growth(
             current_date += timedelta(days=365/periods_per_year)
             
         # Calculate steps
-        nominal_value = calculate_compound_step(nominal_value, rate, monthly_contribution, periods_per_year)
+        nominal_value = nominal_values[period - 1]
         
         if inflation_rate > 0:
              # Deflate nominal value to get real value
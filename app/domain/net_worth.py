@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List
 from pydantic import BaseModel
 from app.models import Asset, Liability, LiquidityStatus
@@ -11,8 +12,8 @@ class NetWorthContext(BaseModel):
     reasoning: List[str]
 
 def get_net_worth(assets: List[Asset], liabilities: List[Liability]) -> NetWorthContext:
-    assets_val = sum(a.value for a in assets)
-    liabilities_val = sum(l.balance for l in liabilities)
+    assets_val = sum(map(attrgetter("value"), assets))
+    liabilities_val = sum(map(attrgetter("balance"), liabilities))
     total = assets_val - liabilities_val
     
     liquid_assets = sum(a.value for a in assets if a.liquidity == LiquidityStatus.LIQUID)
@@ -1,4 +1,5 @@
 import asyncio
+from operator import attrgetter
 from typing import List, Any, Dict
 from app.models import (
     SpendingCategory,
@@ -239,8 +240,8 @@ class FinancialService:
         spending = await self.repo.get_spending_plan()
         
         # Net Worth Logic
-        total_assets = sum(a.value for a in assets)
-        total_liabilities = sum(l.balance for l in liabilities)
+        total_assets = sum(map(attrgetter("value"), assets))
+        total_liabilities = sum(map(attrgetter("balance"), liabilities))
         net_worth = total_assets - total_liabilities
         
         # Ideas Logic
@@ -0,0 +1,232 @@
+"""
+Tests for the SQLite-backed SecureDatabase.
+Runs against an unencrypted database so no password is required.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+from app.data.database import SecureDatabase, derive_key, forget_key
+from app.models import Asset, AssetType, FinancialTask, IncomeSource, Liability, UpcomingExpense
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a connected, unencrypted database in a temp directory."""
+    database = SecureDatabase(tmp_path, encrypted=False)
+    database.connect()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def asset():
+    return Asset(name="Checking", type=AssetType.CASH, value=1500.0)
+
+
+@pytest.fixture
+def liability():
+    return Liability(name="Visa", balance=800.0, interest_rate=0.24, min_payment=25.0)
+
+
+class TestBalances:
+    """Test asset and liability reads."""
+
+    def test_balances_snapshot_returns_both_tables(self, db, asset, liability):
+        """Snapshot should return the same records as the separate getters."""
+        db.save_asset(asset)
+        db.save_liability(liability)
+
+        assets, liabilities = db.get_balances_snapshot()
+
+        assert [a.id for a in assets] == [asset.id]
+        assert [l.id for l in liabilities] == [liability.id]
+
+    def test_balances_snapshot_empty(self, db):
+        """Snapshot of an empty database should be two empty lists."""
+        assert db.get_balances_snapshot() == ([], [])
+
+
+class TestBulkSaves:
+    """Test saving lists of records."""
+
+    def test_save_assets_upserts(self, db, asset):
+        """Saving an asset list twice should replace, not duplicate."""
+        other = Asset(name="Savings", type=AssetType.CASH, value=300.0)
+        db.save_assets([asset, other])
+        asset.value = 2000.0
+        db.save_assets([asset])
+
+        values = {a.id: a.value for a in db.get_assets()}
+
+        assert values == {asset.id: 2000.0, other.id: 300.0}
+
+    def test_save_income_replaces_all(self, db):
+        """Saving income should drop sources that are no longer listed."""
+        db.save_income([IncomeSource(source="Salary", amount=4000.0)])
+        db.save_income([IncomeSource(source="Freelance", amount=500.0)])
+
+        assert [s.source for s in db.get_income()] == ["Freelance"]
+
+
+class TestMigrations:
+    """Test schema upgrades of existing data."""
+
+    def test_text_ids_become_blobs(self, db, asset):
+        """Rows saved with text UUID keys should be found by UUID after upgrading."""
+        db._connection.execute(
+            "INSERT INTO assets (id, data) VALUES (?, ?)", (str(asset.id), asset.model_dump_json())
+        )
+        db._connection.execute("DELETE FROM schema_version WHERE version >= 3")
+        db._run_migrations()
+
+        db.delete_asset(asset.id)
+
+        assert db.get_assets() == []
+
+
+class TestKeyDerivation:
+    """Test the per-process key cache."""
+
+    def test_derive_key_reuses_cached_key(self):
+        """Deriving the same key twice should return the cached result."""
+        salt = b"s" * 32
+
+        assert derive_key("hunter2", salt) is derive_key("hunter2", salt)
+
+    def test_derive_key_depends_on_password_and_salt(self):
+        """Different passwords or salts should not share a cached key."""
+        salt = b"s" * 32
+
+        assert derive_key("hunter2", salt) != derive_key("hunter3", salt)
+        assert derive_key("hunter2", salt) != derive_key("hunter2", b"t" * 32)
+
+    def test_forget_key_drops_cached_key(self):
+        """A forgotten key should be derived afresh."""
+        salt = b"u" * 32
+        key = derive_key("hunter2", salt)
+
+        forget_key("hunter2", salt)
+
+        assert derive_key("hunter2", salt) is not key
+
+
+class TestConnection:
+    """Test opening extra connections."""
+
+    def test_open_copy_sees_same_data(self, db, asset):
+        """A copy should read what the original connection wrote."""
+        db.save_asset(asset)
+
+        copy = db.open_copy()
+        try:
+            assert [a.id for a in copy.get_assets()] == [asset.id]
+        finally:
+            copy.close()
+
+    def test_shared_copy_works_from_another_thread(self, db, asset):
+        """A copy opened with check_same_thread=False should serve other threads."""
+        db.save_asset(asset)
+
+        copy = db.open_copy(check_same_thread=False)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                assets = pool.submit(copy.get_assets).result()
+            assert [a.id for a in assets] == [asset.id]
+        finally:
+            copy.close()
+
+    def test_connection_uses_wal(self, db):
+        """Connections should be opened in write-ahead log mode."""
+        assert db._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_open_copy_requires_connection(self, tmp_path):
+        """Copying a closed database should fail loudly."""
+        with pytest.raises(RuntimeError):
+            SecureDatabase(tmp_path, encrypted=False).open_copy()
+
+
+class TestTasks:
+    """Test task writes."""
+
+    def test_delete_task(self, db):
+        """A deleted task should no longer be returned."""
+        keep = FinancialTask(title="Pay rent")
+        drop = FinancialTask(title="Cancel gym")
+        db.save_task(keep)
+        db.save_task(drop)
+
+        db.delete_task(drop.id)
+
+        assert [t.id for t in db.get_tasks()] == [keep.id]
+
+
+class TestTotals:
+    """Test SQL-side dashboard totals."""
+
+    def test_totals_sum_balances(self, db, asset, liability):
+        """Totals should match summing the loaded models."""
+        db.save_asset(asset)
+        db.save_asset(Asset(name="Brokerage", type=AssetType.EQUITY, value=250.5))
+        db.save_liability(liability)
+
+        totals = db.get_totals()
+
+        assert totals["total_assets"] == sum(a.value for a in db.get_assets())
+        assert totals["asset_count"] == 2
+        assert totals["total_debt"] == 800.0
+        assert totals["debt_count"] == 1
+
+    def test_totals_follow_updates(self, db, asset):
+        """Generated amount columns should track rewritten rows."""
+        db.save_asset(asset)
+        asset.value = 99.0
+        db.save_asset(asset)
+
+        assert db.get_totals()["total_assets"] == 99.0
+
+    def test_totals_count_only_due_expenses(self, db):
+        """Expenses due after the window should be left out of the total."""
+        soon = date.today() + timedelta(days=1)
+        later = date.today() + timedelta(days=60)
+        db.save_expense(UpcomingExpense(name="Rent", amount=1200.0, due_date=soon, category="housing"))
+        db.save_expense(UpcomingExpense(name="Insurance", amount=400.0, due_date=later, category="bills"))
+
+        assert db.get_totals(expense_days=30)["total_expenses"] == 1200.0
+
+    def test_totals_empty(self, db):
+        """An empty database should total zero everywhere."""
+        totals = db.get_totals()
+
+        assert totals["total_assets"] == 0.0
+        assert totals["total_debt"] == 0.0
+        assert totals["task_count"] == 0
+        assert totals["total_expenses"] == 0.0
+
+
+class TestExport:
+    """Test export helpers."""
+
+    def test_export_all_matches_iter_export(self, db, asset, liability):
+        """export_all should contain every table yielded by iter_export."""
+        db.save_asset(asset)
+        db.save_liability(liability)
+
+        data = db.export_all()
+
+        assert data["assets"][0]["name"] == "Checking"
+        assert data["liabilities"][0]["balance"] == 800.0
+        assert data["tasks"] == []
+        assert data["user_profile"] is None
+        assert set(data) == {key for key, _ in db.iter_export()} | {"user_profile"}
+
+    def test_iter_export_rows_orders_values_by_fieldnames(self, db, asset):
+        """Row tuples should line up with the reported field names."""
+        db.save_asset(asset)
+
+        tables = {key: (fieldnames, list(rows)) for key, fieldnames, rows in db.iter_export_rows()}
+        fieldnames, rows = tables["assets"]
+
+        assert fieldnames == list(Asset.model_fields)
+        assert dict(zip(fieldnames, rows[0]))["value"] == 1500.0
+        assert tables["liabilities"][1] == []
@@ -0,0 +1,110 @@
+"""
+Tests for the shared export writers.
+Runs against an unencrypted database so no password is required.
+"""
+import csv
+import gzip
+import json
+
+import pytest
+from app.cli.exporter import write_csv_export, write_json_export
+from app.data.database import SecureDatabase
+from app.models import Asset, AssetType, Liability
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Create a connected, unencrypted database in a temp directory."""
+    database = SecureDatabase(tmp_path, encrypted=False)
+    database.connect()
+    yield database
+    database.close()
+
+
+class TestJsonExport:
+    """Test the streaming JSON writer."""
+
+    def test_json_export_round_trips(self, db, tmp_path):
+        """Streamed output should hold every table, rows as JSON-mode dumps."""
+        asset = Asset(name="Checking", type=AssetType.CASH, value=1500.0)
+        db.save_asset(asset)
+        output_path = tmp_path / "export.json"
+
+        write_json_export(db, output_path)
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert set(data) == set(db.export_all())
+        assert data["assets"] == [asset.model_dump(mode="json")]
+
+    def test_json_export_empty_database(self, db, tmp_path):
+        """An empty database should still produce valid JSON."""
+        output_path = tmp_path / "export.json"
+
+        write_json_export(db, output_path)
+
+        data = json.loads(output_path.read_text(encoding="utf-8"))
+        assert data["assets"] == []
+        assert data["user_profile"] is None
+
+
+class TestCsvExport:
+    """Test the CSV writer."""
+
+    def test_csv_export_skips_empty_tables(self, db, tmp_path):
+        """Only tables with rows should get a file."""
+        db.save_asset(Asset(name="Checking", type=AssetType.CASH, value=1500.0))
+
+        written = write_csv_export(db, tmp_path)
+
+        assert written == ["assets"]
+        assert sorted(p.name for p in tmp_path.glob("*.csv")) == ["assets.csv"]
+
+    def test_csv_export_header_and_values(self, db, tmp_path):
+        """Header should list the model fields and None should be an empty cell."""
+        db.save_liability(Liability(name="Visa", balance=800.0, interest_rate=0.24, min_payment=25.0))
+
+        write_csv_export(db, tmp_path)
+
+        with open(tmp_path / "liabilities.csv", newline="") as f:
+            header, row = list(csv.reader(f))
+        assert header == list(Liability.model_fields)
+        record = dict(zip(header, row))
+        assert record["name"] == "Visa"
+        assert record["balance"] == "800.0"
+        assert record["payment_url"] == ""
+
+    def test_csv_export_quotes_cells_that_need_it(self, db, tmp_path):
+        """Cells with commas or quotes should still round-trip through csv."""
+        db.save_asset(Asset(name='Joint, "Main"', type=AssetType.CASH, value=10.0))
+        db.save_asset(Asset(name="Savings", type=AssetType.CASH, value=20.0))
+
+        write_csv_export(db, tmp_path)
+
+        with open(tmp_path / "assets.csv", newline="") as f:
+            names = sorted(row["name"] for row in csv.DictReader(f))
+        assert names == ['Joint, "Main"', "Savings"]
+
+
+class TestCompressedExport:
+    """Test gzip-compressed exports."""
+
+    def test_compressed_json_export(self, db, tmp_path):
+        """Gzipped JSON should decompress to the plain export."""
+        db.save_asset(Asset(name="Checking", type=AssetType.CASH, value=1500.0))
+        output_path = tmp_path / "export.json.gz"
+
+        write_json_export(db, output_path, compress=True)
+        write_json_export(db, tmp_path / "export.json")
+
+        with gzip.open(output_path, "rt", encoding="utf-8") as f:
+            assert json.load(f) == json.loads((tmp_path / "export.json").read_text(encoding="utf-8"))
+
+    def test_compressed_csv_export(self, db, tmp_path):
+        """Gzipped CSV files should be named .csv.gz and hold the rows."""
+        db.save_asset(Asset(name="Checking", type=AssetType.CASH, value=1500.0))
+
+        write_csv_export(db, tmp_path, compress=True)
+
+        with gzip.open(tmp_path / "assets.csv.gz", "rt", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["name"] == "Checking"
@@ -2,6 +2,7 @@ import pytest
 from app.domain.financial_formulas import (
     calculate_monthly_interest,
     calculate_compound_step,
+    calculate_compound_series,
     calculate_runway,
     calculate_amortization_payment,
     calculate_future_value,
@@ -21,6 +22,16 @@ def test_calculate_compound_step():
     # Interest = 10, New Balance = 1000 + 10 + 100 = 1110
     assert calculate_compound_step(1000, 0.12, 100) == 1110.0
 
+def test_calculate_compound_series_matches_steps():
+    # Each value should equal repeated single steps exactly
+    values = calculate_compound_series(1000, 0.07, 250, 24)
+    expected = []
+    value = 1000
+    for _ in range(24):
+        value = calculate_compound_step(value, 0.07, 250)
+        expected.append(value)
+    assert values == expected
+
 def test_calculate_runway():
     # 10,000 liquidity, 2,000 burn -> 5 months -> 150 days
     assert calculate_runway(10000, 2000) == 150
@@ -39,6 +50,11 @@ def test_calculate_amortization_payment():
     payment = calculate_amortization_payment(100000, 0.05, 30)
     assert abs(payment - 536.82) < 0.1
 
+def test_calculate_amortization_payment_tiny_rate():
+    # A near-zero rate should approach the zero-interest payment, not lose precision
+    payment = calculate_amortization_payment(1000, 1e-12, 1)
+    assert abs(payment - 1000 / 12) < 1e-6
+
 def test_calculate_future_value():
     # 1000 principal, 10% annual, 2 years
     # FV = 1000 * (1.00833)^24 ≈ 1220.39
@@ -0,0 +1,57 @@
+"""
+Tests for the JSON file repository cache.
+"""
+import asyncio
+import os
+import time
+
+import pytest
+from app.data import repository
+from app.data.repository import FileRepository
+from app.models import Asset, AssetType, SpendingCategory
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repository over a temp directory."""
+    return FileRepository(tmp_path)
+
+
+def _rewrite(path, items, model):
+    """Replace a file outside the repository, with a newer mtime, once the TTL is over."""
+    path.write_bytes(repository._LIST_ADAPTERS[model].dump_json(items))
+    stats = os.stat(path)
+    os.utime(path, ns=(stats.st_atime_ns, stats.st_mtime_ns + 1_000_000_000))
+    time.sleep(repository.STAT_TTL * 2)
+
+
+class TestFileRepositoryCache:
+    """Test that cached files are reloaded when they change on disk."""
+
+    def test_spending_plan_reloads_after_outside_change(self, repo):
+        """A spending plan rewritten by someone else should be read again."""
+        first = SpendingCategory(category="Rent", amount=1200.0, type="Need")
+        second = SpendingCategory(category="Dining", amount=300.0, type="Want")
+        repo.spending_file.write_bytes(repository._LIST_ADAPTERS[SpendingCategory].dump_json([first]))
+
+        assert [c.category for c in asyncio.run(repo.get_spending_plan())] == ["Rent"]
+
+        _rewrite(repo.spending_file, [second], SpendingCategory)
+
+        assert [c.category for c in asyncio.run(repo.get_spending_plan())] == ["Dining"]
+
+    def test_assets_reload_after_outside_change(self, repo):
+        """Assets rewritten by someone else should be read again."""
+        first = Asset(name="Checking", type=AssetType.CASH, value=100.0)
+        second = Asset(name="Savings", type=AssetType.CASH, value=200.0)
+        _rewrite(repo.assets_file, [first], Asset)
+
+        assert [a.name for a in asyncio.run(repo.get_assets())] == ["Checking"]
+
+        _rewrite(repo.assets_file, [second], Asset)
+
+        assert [a.name for a in asyncio.run(repo.get_assets())] == ["Savings"]
+
+    def test_missing_file_is_empty(self, repo):
+        """A list file that does not exist should read as empty."""
+        assert asyncio.run(repo.get_assets()) == []